@@ -109,6 +109,8 @@ class ConfiguratorApp(Application, IXamlMetadataProvider):
 
         resources = XamlControlsResources()
         self.resources.merged_dictionaries.append(resources)
+        # Shared styles (e.g. SectionExpanderStyle) used by UIFactory controls
+        UIFactory.initialize()
 
         # Flag to prevent navigation during loading
         self._is_loading = True
@@ -665,8 +667,12 @@ class ConfiguratorApp(Application, IXamlMetadataProvider):
         except Exception as e:
             error(f"Footer action error: {e}", exc_info=True)
 
-    def _save_config(self):
-        """Save configuration to disk - only saves what has changed."""
+    def _save_config(self, on_saved=None):
+        """Save configuration to disk - only saves what has changed.
+
+        on_saved runs after everything is written, which for the styles editor is only
+        once it has answered with its buffer.
+        """
         try:
             saved_something = False
 
@@ -674,19 +680,14 @@ class ConfiguratorApp(Application, IXamlMetadataProvider):
             if self._unsaved_styles:
                 # Try Monaco editor (WebView2) first
                 if self._styles_webview:
-                    try:
-
-                        def save_styles_content(content):
-                            if content:
-                                self._config_manager.save_styles(content)
-
-                        # Use callback pattern to get content and save
-                        self._styles_webview.execute_script_async("getContent()").completed = lambda op, status: (
-                            save_styles_content(json.loads(op.get_results())) if status.value == 1 else None
-                        )
-                        saved_something = True
-                    except Exception as e:
-                        error(f"Error saving styles from Monaco: {e}")
+                    # The pushed snapshot is debounced, so read the live buffer; the styles
+                    # write and mark_saved happen once the editor answers
+                    if self._unsaved_config:
+                        if not self._config_manager.save_config():
+                            return
+                        self._unsaved_config = False
+                    self._styles_page.read_editor_content(lambda content: self._save_styles_content(content, on_saved))
+                    return
                 # Fallback to legacy TextBox
                 elif self._styles_editor:
                     self._config_manager.save_styles(self._styles_editor.text)
@@ -702,6 +703,20 @@ class ConfiguratorApp(Application, IXamlMetadataProvider):
 
             if saved_something:
                 self.mark_saved()
+            if on_saved is not None:
+                on_saved()
+        except Exception as e:
+            error(f"Save error: {e}", exc_info=True)
+
+    def _save_styles_content(self, content, on_saved=None):
+        """Write CSS read from the styles editor, then clear the unsaved state and run on_saved."""
+        try:
+            # Nothing written (unreadable or empty buffer): keep the page dirty so no edits are dropped
+            if not content or not self._config_manager.save_styles(content):
+                return
+            self.mark_saved()
+            if on_saved is not None:
+                on_saved()
         except Exception as e:
             error(f"Save error: {e}", exc_info=True)
 
@@ -762,9 +777,8 @@ class ConfiguratorApp(Application, IXamlMetadataProvider):
         dialog = self.create_dialog(dialog_xaml)
 
         def on_primary(s, e):
-            # Save and close
-            self._save_config()
-            self._window.close()
+            # Save and close; styles may be written asynchronously, so close only once saved
+            self._save_config(on_saved=self._window.close)
 
         def on_secondary(s, e):
             # Discard and close
@@ -6,9 +6,12 @@ intelligent indentation fixing using widget schemas.
 """
 
 import re
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
+from typing import Any, Callable
 
+from core.constants import WEBVIEW_CACHE_DIR
 from core.logger import error
 from core.schema_fetcher import get_widget_key_hierarchy
 from ruamel.yaml import YAML
@@ -17,8 +20,9 @@ from ruamel.yaml.error import YAMLError
 SUPPORTED_LANGUAGES = ["yaml", "css", "json", "javascript", "html", "markdown"]
 
 
+@lru_cache(maxsize=2)
 def _get_yaml_instance(preserve_quotes: bool = True) -> YAML:
-    """Get a configured YAML parser."""
+    """Get a configured YAML parser (built once; YAML instances are reusable across calls)."""
     y = YAML()
     y.preserve_quotes = preserve_quotes
     y.allow_unicode = False
@@ -221,34 +225,20 @@ def fix_yaml_indentation(text: str, widget_type: str | None = None) -> tuple[str
         info = get_key_info(key_name, parent_key)
         return info.get("type") == "list"
 
-    def get_children(schema_key: str) -> set[str]:
-        """Get valid children for a schema key."""
-        if schema_key in hierarchy:
-            info = hierarchy[schema_key]
-            if isinstance(info, dict):
-                return set(info.get("children", []))
-        return set()
+    children_by_key, composites_by_suffix = _index_hierarchy(hierarchy)
 
     def is_valid_child(child_key: str, schema_key: str) -> bool:
         """Check if child_key is valid under schema_key."""
-        children = get_children(schema_key)
-        if child_key in children:
+        if child_key in children_by_key.get(schema_key, ()):
             return True
         # Also check composite keys
-        for key in hierarchy:
-            if "." in key and key.endswith(f".{schema_key}"):
-                info = hierarchy[key]
-                if isinstance(info, dict) and child_key in info.get("children", []):
-                    return True
-        return False
+        return any(child_key in children_by_key.get(key, ()) for key in composites_by_suffix.get(schema_key, ()))
 
     def get_schema_for_list_items(parent_key: str) -> str:
         """Get the schema key that defines valid children for list items under parent_key."""
         # Check for composite key first (e.g., "providers.models")
-        for key in hierarchy:
-            if "." in key and key.endswith(f".{parent_key}"):
-                return key
-        return parent_key
+        composites = composites_by_suffix.get(parent_key)
+        return composites[0] if composites else parent_key
 
     for i, line in enumerate(lines):
         stripped = line.strip()
@@ -374,6 +364,33 @@ def fix_yaml_indentation(text: str, widget_type: str | None = None) -> tuple[str
         return fixed_text, f"Partial fix applied. Remaining error: {error_msg}"
 
 
+# Index of the last hierarchy seen; the schema database hands out the same dict until it changes
+_hierarchy_index_cache = {"hierarchy": None, "index": None}
+
+
+def _index_hierarchy(hierarchy: dict[str, dict]) -> tuple[dict[str, set[str]], dict[str, list[str]]]:
+    """Index a key hierarchy for the per-line lookups in fix_yaml_indentation.
+
+    Returns the child-name set of every key, and the composite keys (e.g. "providers.models")
+    grouped by each dotted suffix they end with, in hierarchy order.
+    """
+    if _hierarchy_index_cache["hierarchy"] is hierarchy:
+        return _hierarchy_index_cache["index"]
+
+    children_by_key = {}
+    composites_by_suffix: dict[str, list[str]] = {}
+    for key, info in hierarchy.items():
+        if isinstance(info, dict):
+            children_by_key[key] = set(info.get("children", []))
+        dot = key.find(".")
+        while dot != -1:
+            composites_by_suffix.setdefault(key[dot + 1 :], []).append(key)
+            dot = key.find(".", dot + 1)
+    _hierarchy_index_cache["hierarchy"] = hierarchy
+    _hierarchy_index_cache["index"] = (children_by_key, composites_by_suffix)
+    return children_by_key, composites_by_suffix
+
+
 def _extract_options_lines(lines: list, options_line: int, options_indent: int) -> list:
     """Extract and re-indent options content from full widget paste."""
     result = []
@@ -457,12 +474,72 @@ def get_code_editor_html_path() -> str:
     return str(html_path.resolve())
 
 
+@lru_cache(maxsize=None)
 def get_code_editor_html_uri() -> str:
     """Get the file URI for the code editor HTML file."""
     path = get_code_editor_html_path()
     return Path(path).as_uri()
 
 
+_webview_env = None
+_webview_env_waiters: list[Callable[[Any, Exception | None], None]] = []
+
+
+def get_webview_environment(callback: Callable[[Any, Exception | None], None]) -> None:
+    """
+    Hand the shared CoreWebView2Environment to callback, creating it on first use.
+
+    Creating an environment starts the WebView2 browser processes, so every editor
+    in the app reuses one. callback receives (env, None) on success, (None, error)
+    on failure, or (None, None) if creation was canceled.
+    """
+    global _webview_env
+
+    if _webview_env is not None:
+        callback(_webview_env, None)
+        return
+
+    _webview_env_waiters.append(callback)
+    if len(_webview_env_waiters) > 1:
+        return  # Creation already in flight
+
+    from ctypes import WinError
+
+    from webview2.microsoft.web.webview2.core import CoreWebView2Environment
+    from winrt.windows.foundation import AsyncStatus
+
+    def on_env_created(op, status):
+        global _webview_env
+        if status == AsyncStatus.COMPLETED:
+            _webview_env = op.get_results()
+            result, err = _webview_env, None
+        elif status == AsyncStatus.ERROR:
+            result, err = None, WinError(op.error_code.value)
+        else:
+            # Canceled: nothing to report, callers simply stop
+            result, err = None, None
+
+        waiters = _webview_env_waiters[:]
+        _webview_env_waiters.clear()
+        for waiter in waiters:
+            waiter(result, err)
+
+    env_op = CoreWebView2Environment.create_with_options_async("", WEBVIEW_CACHE_DIR, None)
+    env_op.completed = on_env_created
+
+
+_css_tools_script: str | None = None
+
+
+def get_css_tools_script() -> str:
+    """Get the CSS format/cleanup helpers injected into the styles editor (read once)."""
+    global _css_tools_script
+    if _css_tools_script is None:
+        script_path = Path(__file__).parent / "editor" / "css_tools.js"
+        _css_tools_script = script_path.read_text(encoding="utf-8")
+    return _css_tools_script
+
+
 def extract_widget_options(parsed: dict, expected_type: str | None = None) -> tuple[dict | None, str | None]:
     """Extract widget options from parsed YAML dict.
 
@@ -11,6 +11,7 @@ import shutil
 import tempfile
 import zipfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -37,8 +38,9 @@ def _normalize(obj):
     return str(obj)
 
 
+@lru_cache(maxsize=1)
 def _get_yaml() -> YAML:
-    """Get a configured YAML instance."""
+    """Get a configured YAML instance (built once; YAML instances are reusable across calls)."""
     y = YAML()
     y.preserve_quotes = True
     y.allow_unicode = False
@@ -247,8 +249,10 @@ class ConfigManager:
             widgets = bar.get("widgets") or {}
             for position in ["left", "center", "right"]:
                 pos_widgets = widgets.get(position) or []
-                if widget_name in pos_widgets:
-                    pos_widgets.remove(widget_name)
+                # Delete in place, last index first, so ruamel keeps the comments of the remaining items
+                for i in reversed(range(len(pos_widgets))):
+                    if pos_widgets[i] == widget_name:
+                        del pos_widgets[i]
         del self._config["widgets"][widget_name]
         return True
 
@@ -0,0 +1,83 @@
+// CSS helpers for the Styles editor context menu.
+// Injected once per WebView2 via AddScriptToExecuteOnDocumentCreated, so the
+// menu items only have to call these functions instead of shipping the code.
+
+const WS_RE = /\s/;
+const BLOCK_COMMENT_RE = /\/\*[\s\S]*?\*\//g;
+
+window.__yasbFormatCss = function () {
+    if (!window.editor) return;
+    var css = editor.getValue();
+    var parts = [];
+    var indent = 0;
+    var inRule = false;
+    // True while the output ends with a newline plus indentation (or ',\n')
+    var lastWasNewline = true;
+    // Existing formatting is dropped on the fly: a whitespace run counts as one space
+    var lastWasSpace = false;
+
+    for (var i = 0; i < css.length; i++) {
+        var c = css[i];
+        if (WS_RE.test(c)) {
+            if (lastWasSpace) continue;
+            lastWasSpace = true;
+            c = ' ';
+        } else {
+            lastWasSpace = false;
+        }
+
+        if (c === '{') {
+            indent++;
+            parts.push(' {\n', '  '.repeat(indent));
+            inRule = true;
+            lastWasNewline = true;
+        } else if (c === '}') {
+            indent--;
+            // Drop trailing whitespace tokens instead of trimming the whole buffer
+            while (parts.length) {
+                var last = parts[parts.length - 1].trimEnd();
+                if (last) { parts[parts.length - 1] = last; break; }
+                parts.pop();
+            }
+            parts.push('\n', '  '.repeat(indent), '}\n', indent === 0 ? '\n' : '');
+            inRule = false;
+            lastWasNewline = indent === 0;
+        } else if (c === ';' && inRule) {
+            parts.push(';\n', '  '.repeat(indent));
+            lastWasNewline = true;
+        } else if (c === ',' && !inRule) {
+            // Multiple selectors - put each on new line
+            parts.push(',\n');
+            lastWasNewline = true;
+        } else if (c === ' ' && lastWasNewline) {
+            // Skip leading space after newline
+        } else {
+            parts.push(c);
+            lastWasNewline = false;
+        }
+    }
+    editor.setValue(parts.join('').trim());
+};
+
+window.__yasbCleanupCss = function () {
+    if (!window.editor) return;
+    var model = editor.getModel();
+    var text = model.getValue();
+    // Delete only the block comment ranges so untouched lines keep their tokens and undo history
+    var edits = [];
+    var m;
+    BLOCK_COMMENT_RE.lastIndex = 0;
+    while ((m = BLOCK_COMMENT_RE.exec(text))) {
+        var start = model.getPositionAt(m.index);
+        var end = model.getPositionAt(m.index + m[0].length);
+        edits.push({
+            range: new monaco.Range(start.lineNumber, start.column, end.lineNumber, end.column),
+            text: ''
+        });
+    }
+    if (edits.length) {
+        editor.pushUndoStop();
+        model.pushEditOperations([], edits, function () { return null; });
+        editor.pushUndoStop();
+    }
+};
@@ -0,0 +1,71 @@
+"""
+.env file parsing and writing for the Environment Variables page.
+
+Commented-out assignments are kept as disabled variables, and values that
+contain whitespace, comments or quotes are written double-quoted.
+"""
+
+import re
+from typing import Iterable
+
+# Values containing whitespace, comments or quotes must be wrapped in double quotes
+_QUOTE_RE = re.compile(r'[\s#"\']')
+
+
+class EnvVariable:
+    """Single .env entry. Rows keep a reference to it, so deletes never shift indices."""
+
+    __slots__ = ("name", "value", "enabled")
+
+    def __init__(self, name, value, enabled):
+        self.name = name
+        self.value = value
+        self.enabled = enabled
+
+
+def parse_env_line(line: str) -> EnvVariable | None:
+    """Parse one .env line; returns None for blank lines, comments and anything without '='."""
+    line = line.strip()
+    if not line:
+        return None
+    enabled = True
+    if line[0] == "#":
+        # Commented-out assignments are disabled variables
+        line = line[1:].lstrip()
+        enabled = False
+    if "=" not in line:
+        return None
+    name, value = line.split("=", 1)
+    name = name.strip()
+    value = value.strip()
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        value = value[1:-1].replace('\\"', '"')
+    elif len(value) >= 2 and value[0] == "'" and value[-1] == "'":
+        value = value[1:-1]
+    return EnvVariable(name, value, enabled)
+
+
+def parse_env_lines(lines: Iterable[str]) -> list[EnvVariable]:
+    """Parse .env content given as lines (a file object works)."""
+    variables = []
+    for line in lines:
+        var = parse_env_line(line)
+        if var is not None:
+            variables.append(var)
+    return variables
+
+
+def serialize_env(variables: Iterable[EnvVariable]) -> str:
+    """Render variables as .env file content, skipping rows without a name."""
+    lines = []
+    for var in variables:
+        name, value = var.name, var.value
+        if not name.strip():
+            continue
+        if _QUOTE_RE.search(value):
+            value = '"' + value.replace('"', '\\"') + '"'
+        line = f"{name}={value}"
+        if not var.enabled:
+            line = f"# {line}"
+        lines.append(line)
+    return "\n".join(lines) + "\n" if lines else ""
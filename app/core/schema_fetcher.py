@@ -12,7 +12,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from core.constants import SCHEMA_DB_PATH
+from core.constants import APP_VERSION, SCHEMA_DB_PATH
 from core.errors import get_friendly_error_message
 from core.logger import error, info
 
@@ -28,31 +28,79 @@ def is_database_valid() -> bool:
     return bool(db.get("widgets"))
 
 
+_db_cache = {"key": None, "db": {}}
+
+
 def load_schema_database() -> dict[str, Any]:
+    """Load the schema database (re-parsed only when the file changes)."""
+    path = SCHEMA_DB_PATH
+    try:
+        key = (path, path.stat().st_mtime_ns)
+    except OSError:
+        return {}
+    if _db_cache["key"] == key:
+        return _db_cache["db"]
+
     try:
-        if SCHEMA_DB_PATH.exists():
-            with open(SCHEMA_DB_PATH, "r", encoding="utf-8") as f:
-                return json.load(f)
+        # json detects UTF-8 from bytes, skipping the text-mode reader
+        with open(path, "rb") as f:
+            db = json.load(f)
     except Exception as e:
         error(f"Failed to load schema database: {e}")
-    return {}
+        return {}
+    _db_cache["key"] = key
+    _db_cache["db"] = db
+    return db
 
 
 def save_schema_database(schemas: dict[str, Any]) -> bool:
+    path = SCHEMA_DB_PATH
     try:
-        SCHEMA_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(SCHEMA_DB_PATH, "w", encoding="utf-8") as f:
-            json.dump(schemas, f, indent=2)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            # One write of the encoded text; json.dump would issue a write per token
+            f.write(json.dumps(schemas, indent=2))
+        _db_cache["key"] = (path, path.stat().st_mtime_ns)
+        _db_cache["db"] = schemas
         return True
     except Exception as e:
+        _db_cache["key"] = None
         error(f"Failed to save schema database: {e}")
         return False
 
 
-def _download_schema_json(progress_callback=None) -> dict[str, Any] | None:
+# Returned by _download_schema_json when the server answers 304 Not Modified
+_NOT_MODIFIED = object()
+
+
+def _cached_validators(cached: dict[str, Any] | None) -> dict[str, str]:
+    """ETag/Last-Modified of the database on disk, if it was built from the current source by this app version."""
+    if not cached or not cached.get("widgets"):
+        return {}
+    meta = cached.get("_meta", {})
+    if meta.get("version") != 1 or meta.get("source") != SCHEMA_JSON_URL:
+        return {}
+    # A new release may extract schemas differently, so rebuild even if schema.json is unchanged
+    if meta.get("app_version") != APP_VERSION:
+        return {}
+    return {key: meta[key] for key in ("etag", "last_modified") if meta.get(key)}
+
+
+def _download_schema_json(progress_callback=None, validators: dict[str, str] | None = None):
+    """Download schema.json, returning ``(schema_json, validators)``.
+
+    With ``validators`` from a previous download the request is conditional, and
+    ``schema_json`` is ``_NOT_MODIFIED`` when the server has nothing newer.
+    """
+    headers = {"User-Agent": "YASB-Config/1.0"}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
     try:
         info(f"Downloading JSON schema from {SCHEMA_JSON_URL}...")
-        req = urllib.request.Request(SCHEMA_JSON_URL, headers={"User-Agent": "YASB-Config/1.0"})
+        req = urllib.request.Request(SCHEMA_JSON_URL, headers=headers)
         with urllib.request.urlopen(req, timeout=60) as response:
             total_size = int(response.headers.get("Content-Length", 0))
             downloaded = 0
@@ -69,12 +117,21 @@ def _download_schema_json(progress_callback=None) -> dict[str, Any] | None:
                         progress_callback(downloaded, 0, f"Downloading... {downloaded // 1024} KB")
 
             info("Schema download complete.")
-            return json.loads(b"".join(chunks))
+            new_validators = {
+                "etag": response.headers.get("ETag", ""),
+                "last_modified": response.headers.get("Last-Modified", ""),
+            }
+            return json.loads(b"".join(chunks)), {k: v for k, v in new_validators.items() if v}
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            info("Schema not modified since last download.")
+            return _NOT_MODIFIED, validators or {}
+        error(f"Network error during download: {e.reason if hasattr(e, 'reason') else e}")
     except urllib.error.URLError as e:
         error(f"Network error during download: {e.reason if hasattr(e, 'reason') else e}")
     except Exception as e:
         error(f"Failed to download schema: {e}")
-    return None
+    return None, {}
 
 
 def _resolve_ref(ref: str, defs: dict[str, Any]) -> dict[str, Any] | None:
@@ -221,13 +278,22 @@ def _extract_widget_option_schemas(schema_json: dict[str, Any]) -> dict[str, dic
     return widget_schemas
 
 
-def fetch_all_schemas(progress_callback=None) -> dict[str, Any]:
-    """Fetch all widget schemas from GitHub."""
-    schemas = {"_meta": {"version": 1, "source": SCHEMA_JSON_URL}, "widgets": {}}
+def fetch_all_schemas(progress_callback=None, cached: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Fetch all widget schemas from GitHub.
+
+    If ``cached`` is the current database and schema.json has not changed on the
+    server, ``cached`` itself is returned without downloading or rebuilding anything.
+    """
+    schemas = {"_meta": {"version": 1, "source": SCHEMA_JSON_URL, "app_version": APP_VERSION}, "widgets": {}}
 
-    schema_json = _download_schema_json(progress_callback)
+    schema_json, validators = _download_schema_json(progress_callback, _cached_validators(cached))
+    if schema_json is _NOT_MODIFIED:
+        if progress_callback:
+            progress_callback(100, 100, "Complete!")
+        return cached
     if not schema_json:
         return schemas
+    schemas["_meta"].update(validators)
 
     defs = schema_json.get("$defs", {})
     widget_options = _extract_widget_option_schemas(schema_json)
@@ -250,13 +316,18 @@ def update_schema_database(progress_callback=None) -> tuple[bool, str]:
     """Update the local schema database from GitHub."""
     try:
         info("Starting schema database update...")
-        schemas = fetch_all_schemas(progress_callback)
+        cached = load_schema_database()
+        schemas = fetch_all_schemas(progress_callback, cached)
 
         widget_count = len(schemas.get("widgets", {}))
         if widget_count == 0:
             error("Schema update finished but 0 widgets were found/parsed. Check logs for regex/extraction failures.")
             return False, "No schemas found. Check your internet connection."
 
+        if schemas is cached:
+            info(f"Schema database is up to date ({widget_count} widgets)")
+            return True, f"Widget schemas are up to date ({widget_count} widgets)"
+
         schemas["_meta"]["updated"] = datetime.now().isoformat()
 
         if save_schema_database(schemas):
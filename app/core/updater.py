@@ -41,7 +41,7 @@ class AssetUpdater:
             return None, 999
 
         try:
-            with open(self._metadata_path, "r", encoding="utf-8") as f:
+            with open(self._metadata_path, "rb") as f:
                 data = json.load(f)
                 last_updated = data.get("last_database_updated")
 
@@ -59,7 +59,7 @@ class AssetUpdater:
         try:
             if self._metadata_path.exists():
                 try:
-                    with open(self._metadata_path, "r", encoding="utf-8") as f:
+                    with open(self._metadata_path, "rb") as f:
                         data = json.load(f)
                 except:
                     data = {}
@@ -82,7 +82,7 @@ class AssetUpdater:
         if not self._metadata_path.exists():
             return False
         try:
-            with open(self._metadata_path, "r", encoding="utf-8") as f:
+            with open(self._metadata_path, "rb") as f:
                 data = json.load(f)
                 last_version = data.get("last_database_app_version")
                 if last_version and last_version != APP_VERSION:
@@ -96,7 +96,7 @@ class AssetUpdater:
         if not self._registry_path.exists():
             return False
         try:
-            with open(self._registry_path, "r", encoding="utf-8") as f:
+            with open(self._registry_path, "rb") as f:
                 data = json.load(f)
                 return "widgets" in data
         except:
@@ -225,7 +225,7 @@ class AppUpdater:
         try:
             if self._metadata_path.exists():
                 try:
-                    with open(self._metadata_path, "r", encoding="utf-8") as f:
+                    with open(self._metadata_path, "rb") as f:
                         data = json.load(f)
                 except:
                     data = {}
@@ -255,7 +255,7 @@ class AppUpdater:
             return True, ""
 
         try:
-            with open(self._metadata_path, "r", encoding="utf-8") as f:
+            with open(self._metadata_path, "rb") as f:
                 data = json.load(f)
                 last_check = data.get("last_app_update_check")
 
@@ -282,7 +282,7 @@ class AppUpdater:
             return None
 
         try:
-            with open(self._metadata_path, "r", encoding="utf-8") as f:
+            with open(self._metadata_path, "rb") as f:
                 data = json.load(f)
                 version = data.get("available_update_version")
                 url = data.get("available_update_url")
@@ -7,7 +7,7 @@ Manages bar creation, deletion, and settings.
 import ctypes
 import re
 import webbrowser
-from collections import Counter, OrderedDict
+from collections import Counter
 from ctypes import wintypes
 
 from core.localization import t
@@ -553,82 +553,79 @@ class BarsPage:
             anim_expander.content = anim_panel
             panel.children.append(anim_expander)
 
-            # === Layouts Section ===
+            # === Layouts Section (built on first expand) ===
             layouts_expander = self._ui.create_expander(t("bars_layouts"), t("bars_layouts_desc"))
             layouts_expander.horizontal_alignment = 3  # Stretch
-            layouts_panel = self._ui.create_stack_panel(spacing=8)
+            self._ui.attach_expander_content(layouts_expander, lambda: self._build_layouts_panel(bar_name, bar))
+            panel.children.append(layouts_expander)
 
-            layouts = bar.get("layouts", {})
-            align_options = ["left", "center", "right"]
+            self._app._loading = False
+        except Exception as e:
+            error(f"Load bar error: {e}", exc_info=True)
+            self._app._loading = False
 
-            # Left layout
-            layouts_panel.children.append(self._ui.create_text_block(t("bars_layout_left"), "BodyStrongTextBlockStyle"))
-            left_layout = layouts.get("left", {})
-            left_align = self._ui.create_combobox(
-                t("bars_layout_alignment"), align_options, left_layout.get("alignment", "left")
-            )
-            left_align.add_selection_changed(
-                lambda s, e: self._update_bar_layout(
-                    bar_name, "left", "alignment", align_options[left_align.selected_index]
-                )
-            )
-            layouts_panel.children.append(left_align)
+    def _build_layouts_panel(self, bar_name, bar):
+        """Build the left/center/right layout controls for a bar."""
+        layouts_panel = self._ui.create_stack_panel(spacing=8)
 
-            left_stretch = self._ui.create_toggle(t("bars_layout_stretch"), left_layout.get("stretch", True))
-            left_stretch.add_toggled(
-                lambda s, e: self._update_bar_layout(bar_name, "left", "stretch", left_stretch.is_on)
-            )
-            layouts_panel.children.append(left_stretch)
+        layouts = bar.get("layouts", {})
+        align_options = ["left", "center", "right"]
 
-            # Center layout
-            layouts_panel.children.append(
-                self._ui.create_text_block(t("bars_layout_center"), "BodyStrongTextBlockStyle")
-            )
-            center_layout = layouts.get("center", {})
-            center_align = self._ui.create_combobox(
-                t("bars_layout_alignment"), align_options, center_layout.get("alignment", "center")
-            )
-            center_align.add_selection_changed(
-                lambda s, e: self._update_bar_layout(
-                    bar_name, "center", "alignment", align_options[center_align.selected_index]
-                )
+        # Left layout
+        layouts_panel.children.append(self._ui.create_text_block(t("bars_layout_left"), "BodyStrongTextBlockStyle"))
+        left_layout = layouts.get("left", {})
+        left_align = self._ui.create_combobox(
+            t("bars_layout_alignment"), align_options, left_layout.get("alignment", "left")
+        )
+        left_align.add_selection_changed(
+            lambda s, e: self._update_bar_layout(
+                bar_name, "left", "alignment", align_options[left_align.selected_index]
             )
-            layouts_panel.children.append(center_align)
+        )
+        layouts_panel.children.append(left_align)
 
-            center_stretch = self._ui.create_toggle(t("bars_layout_stretch"), center_layout.get("stretch", True))
-            center_stretch.add_toggled(
-                lambda s, e: self._update_bar_layout(bar_name, "center", "stretch", center_stretch.is_on)
-            )
-            layouts_panel.children.append(center_stretch)
+        left_stretch = self._ui.create_toggle(t("bars_layout_stretch"), left_layout.get("stretch", True))
+        left_stretch.add_toggled(lambda s, e: self._update_bar_layout(bar_name, "left", "stretch", left_stretch.is_on))
+        layouts_panel.children.append(left_stretch)
 
-            # Right layout
-            layouts_panel.children.append(
-                self._ui.create_text_block(t("bars_layout_right"), "BodyStrongTextBlockStyle")
-            )
-            right_layout = layouts.get("right", {})
-            right_align = self._ui.create_combobox(
-                t("bars_layout_alignment"), align_options, right_layout.get("alignment", "right")
-            )
-            right_align.add_selection_changed(
-                lambda s, e: self._update_bar_layout(
-                    bar_name, "right", "alignment", align_options[right_align.selected_index]
-                )
+        # Center layout
+        layouts_panel.children.append(self._ui.create_text_block(t("bars_layout_center"), "BodyStrongTextBlockStyle"))
+        center_layout = layouts.get("center", {})
+        center_align = self._ui.create_combobox(
+            t("bars_layout_alignment"), align_options, center_layout.get("alignment", "center")
+        )
+        center_align.add_selection_changed(
+            lambda s, e: self._update_bar_layout(
+                bar_name, "center", "alignment", align_options[center_align.selected_index]
             )
-            layouts_panel.children.append(right_align)
+        )
+        layouts_panel.children.append(center_align)
 
-            right_stretch = self._ui.create_toggle(t("bars_layout_stretch"), right_layout.get("stretch", True))
-            right_stretch.add_toggled(
-                lambda s, e: self._update_bar_layout(bar_name, "right", "stretch", right_stretch.is_on)
-            )
-            layouts_panel.children.append(right_stretch)
+        center_stretch = self._ui.create_toggle(t("bars_layout_stretch"), center_layout.get("stretch", True))
+        center_stretch.add_toggled(
+            lambda s, e: self._update_bar_layout(bar_name, "center", "stretch", center_stretch.is_on)
+        )
+        layouts_panel.children.append(center_stretch)
 
-            layouts_expander.content = layouts_panel
-            panel.children.append(layouts_expander)
+        # Right layout
+        layouts_panel.children.append(self._ui.create_text_block(t("bars_layout_right"), "BodyStrongTextBlockStyle"))
+        right_layout = layouts.get("right", {})
+        right_align = self._ui.create_combobox(
+            t("bars_layout_alignment"), align_options, right_layout.get("alignment", "right")
+        )
+        right_align.add_selection_changed(
+            lambda s, e: self._update_bar_layout(
+                bar_name, "right", "alignment", align_options[right_align.selected_index]
+            )
+        )
+        layouts_panel.children.append(right_align)
 
-            self._app._loading = False
-        except Exception as e:
-            error(f"Load bar error: {e}", exc_info=True)
-            self._app._loading = False
+        right_stretch = self._ui.create_toggle(t("bars_layout_stretch"), right_layout.get("stretch", True))
+        right_stretch.add_toggled(
+            lambda s, e: self._update_bar_layout(bar_name, "right", "stretch", right_stretch.is_on)
+        )
+        layouts_panel.children.append(right_stretch)
+        return layouts_panel
 
     def _update_bar(self, bar_name, key, value):
         """Update a bar property."""
@@ -723,18 +720,12 @@ class BarsPage:
     def _rename_bar(self, old_name, new_name):
         """Rename a bar in the config."""
         try:
-            bars = self._config_manager.config.get("bars", {})
-            if old_name not in bars or new_name in bars:
+            bars = self._config_manager.config.get("bars")
+            if not bars or old_name not in bars or new_name in bars:
                 return False
 
-            new_bars = OrderedDict()
-            for name, config in bars.items():
-                if name == old_name:
-                    new_bars[new_name] = config
-                else:
-                    new_bars[name] = config
-
-            self._config_manager.config["bars"] = dict(new_bars)
+            # dict preserves insertion order, so the renamed bar keeps its position
+            self._config_manager.config["bars"] = {(new_name if k == old_name else k): v for k, v in bars.items()}
             return True
         except Exception as e:
             error(f"Rename bar error: {e}", exc_info=True)
@@ -754,8 +745,9 @@ class BarsPage:
         if not bar_to_delete:
             return
 
-        if bar_to_delete in self._config_manager.config.get("bars", {}):
-            del self._config_manager.config["bars"][bar_to_delete]
+        bars = self._config_manager.config.get("bars")
+        if bars and bar_to_delete in bars:
+            del bars[bar_to_delete]
             self._selected_bar = None  # Clear selection
             self._app.mark_unsaved()
             self._refresh_bar_selector()
@@ -5,9 +5,10 @@ Manages .env file for YASB configuration.
 """
 
 import os
-import webbrowser
+from functools import lru_cache, partial
 from pathlib import Path
 
+from core.env_file import EnvVariable, parse_env_lines, serialize_env
 from core.localization import t
 from core.logger import error
 from ui.controls import UIFactory
@@ -30,6 +31,14 @@ COMMON_VARIABLES = [
 ]
 
 
+@lru_cache(maxsize=1)
+def _get_env_path():
+    """Get path to .env file (resolved once per process)."""
+    config_home = os.getenv("YASB_CONFIG_HOME", ".config\\yasb")
+    config_dir = os.path.join(Path.home(), config_home)
+    return os.path.join(config_dir, ".env")
+
+
 class EnvVariablesPage:
     """Manages the Environment Variables page."""
 
@@ -39,69 +48,41 @@ class EnvVariablesPage:
         self._ui = UIFactory()
         self._main_panel = None
         self._variables_panel = None
-        self._env_path = self._get_env_path()
+        self._env_path = _get_env_path()
         self._variables = []
-
-    def _get_env_path(self):
-        """Get path to .env file."""
-        config_home = os.getenv("YASB_CONFIG_HOME", ".config\\yasb")
-        config_dir = os.path.join(Path.home(), config_home)
-        return os.path.join(config_dir, ".env")
+        self._rows = {}
+        self._saved_content = None
 
     def _load_env_file(self):
         """Load variables from .env file."""
         self._variables = []
+        self._saved_content = None
         if not os.path.isfile(self._env_path):
             return
 
         try:
             with open(self._env_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or "=" not in line:
-                        if line.startswith("#") and "=" in line:
-                            line = line[1:].strip()
-                            self._parse_variable_line(line, enabled=False)
-                        continue
-
-                    if line.startswith("#"):
-                        line = line[1:].strip()
-                        self._parse_variable_line(line, enabled=False)
-                    else:
-                        self._parse_variable_line(line, enabled=True)
+                self._variables = parse_env_lines(f)
+            # What a save would write right now, so no-op saves leave the file untouched
+            self._saved_content = serialize_env(self._variables)
         except Exception as e:
             error(f"Error loading .env file: {e}")
 
-    def _parse_variable_line(self, line, enabled):
-        """Parse single variable line."""
-        if "=" not in line:
-            return
-        parts = line.split("=", 1)
-        if len(parts) == 2:
-            name = parts[0].strip()
-            value = parts[1].strip()
-            if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-                value = value[1:-1]
-            self._variables.append([name, value, enabled])
+    def _variable_names(self):
+        """Set of variable names for O(1) existence checks."""
+        return {v.name for v in self._variables}
 
     def _save_env_file(self):
         """Save variables to .env file."""
         try:
-            lines = []
-            for name, value, enabled in self._variables:
-                if not name.strip():
-                    continue
-                if " " in value:
-                    value = f'"{value}"'
-                line = f"{name}={value}"
-                if not enabled:
-                    line = f"# {line}"
-                lines.append(line)
+            content = serialize_env(self._variables)
+            # Typing into an unnamed row changes nothing on disk, skip the write
+            if content == self._saved_content:
+                return True
 
             with open(self._env_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-                if lines:
-                    f.write("\n")
+                f.write(content)
+            self._saved_content = content
             return True
         except Exception as e:
             error(f"Error saving .env file: {e}")
@@ -193,9 +174,10 @@ class EnvVariablesPage:
         common_expander.horizontal_alignment = 3
 
         common_panel = self._ui.create_stack_panel(spacing=8)
+        existing = self._variable_names()
 
         for var_name, default_value, desc_key in COMMON_VARIABLES:
-            exists = any(v[0] == var_name for v in self._variables)
+            exists = var_name in existing
             row = self._ui.create_stack_panel(spacing=4, orientation="Horizontal")
 
             add_btn = self._ui.create_icon_button("\ue710", padding="8,4")
@@ -240,19 +222,28 @@ class EnvVariablesPage:
         link_panel = self._ui.create_stack_panel(spacing=4, orientation="Horizontal")
         link_panel.margin = Thickness(0, 8, 0, 0)
         link_btn = self._ui.create_hyperlink_button(t("env_wiki_link"))
-        link_btn.add_click(lambda s, e: webbrowser.open(ENV_WIKI_URL))
+        link_btn.add_click(lambda s, e: self._open_wiki())
         link_panel.children.append(link_btn)
         self._main_panel.children.append(link_panel)
 
         notice = self._ui.create_info_bar(t("env_restart_notice"), margin="0,16,0,0")
         self._main_panel.children.append(notice)
 
+    def _open_wiki(self):
+        """Open the environment variables wiki page."""
+        # Imported on demand, webbrowser pulls in subprocess/shlex and probes the registry
+        import webbrowser
+
+        webbrowser.open(ENV_WIKI_URL)
+
     def _rebuild_variables_list(self):
         """Rebuild the variables list UI."""
         self._variables_panel.children.clear()
+        self._rows = {}
 
-        for idx, (name, value, enabled) in enumerate(self._variables):
-            row = self._create_variable_row(idx, name, value, enabled)
+        for var in self._variables:
+            row = self._create_variable_row(var)
+            self._rows[var] = row
             self._variables_panel.children.append(row)
 
         add_row = self._ui.create_stack_panel(spacing=8, orientation="Horizontal")
@@ -261,64 +252,84 @@ class EnvVariablesPage:
         add_row.children.append(add_btn)
         self._variables_panel.children.append(add_row)
 
-    def _create_variable_row(self, idx, name, value, enabled):
+    def _create_variable_row(self, var):
         """Create a row for a single variable."""
         row = XamlReader.load(load_xaml("components/EnvVariableRow.xaml")).as_(Grid)
 
         checkbox = row.find_name("EnableCheckbox").as_(CheckBox)
-        checkbox.is_checked = enabled
-        checkbox.add_checked(lambda s, e, i=idx: self._update_variable_enabled(i, True))
-        checkbox.add_unchecked(lambda s, e, i=idx: self._update_variable_enabled(i, False))
+        checkbox.is_checked = var.enabled
+        checkbox.add_checked(partial(self._on_enabled_changed, var, True))
+        checkbox.add_unchecked(partial(self._on_enabled_changed, var, False))
 
         name_box = row.find_name("NameTextbox").as_(TextBox)
-        name_box.text = name
-        name_box.add_text_changed(lambda s, e, i=idx: self._update_variable_name(i, name_box.text))
+        name_box.text = var.name
+        name_box.add_text_changed(partial(self._on_name_changed, var, name_box))
 
         value_box = row.find_name("ValueTextbox").as_(TextBox)
-        value_box.text = value
-        value_box.add_text_changed(lambda s, e, i=idx: self._update_variable_value(i, value_box.text))
+        value_box.text = var.value
+        value_box.add_text_changed(partial(self._on_value_changed, var, value_box))
 
         delete_btn = row.find_name("DeleteButton").as_(Button)
-        delete_btn.add_click(lambda s, e, i=idx: self._delete_variable(i))
+        delete_btn.add_click(partial(self._on_delete_clicked, var))
 
         return row
 
-    def _update_variable_enabled(self, idx, enabled):
+    def _on_enabled_changed(self, var, enabled, sender, args):
+        """Handle enabled toggle change."""
+        self._update_variable_enabled(var, enabled)
+
+    def _on_name_changed(self, var, name_box, sender, args):
+        """Handle name text change."""
+        self._update_variable_name(var, name_box.text)
+
+    def _on_value_changed(self, var, value_box, sender, args):
+        """Handle value text change."""
+        self._update_variable_value(var, value_box.text)
+
+    def _on_delete_clicked(self, var, sender, args):
+        """Handle delete button click."""
+        self._delete_variable(var)
+
+    def _update_variable_enabled(self, var, enabled):
         """Update variable enabled state."""
-        if idx < len(self._variables):
-            self._variables[idx][2] = enabled
+        if var in self._rows:
+            var.enabled = enabled
             self._save_env_file()
 
-    def _update_variable_name(self, idx, name):
+    def _update_variable_name(self, var, name):
         """Update variable name."""
-        if idx < len(self._variables):
-            self._variables[idx][0] = name
+        if var in self._rows:
+            var.name = name
             self._save_env_file()
 
-    def _update_variable_value(self, idx, value):
+    def _update_variable_value(self, var, value):
         """Update variable value."""
-        if idx < len(self._variables):
-            self._variables[idx][1] = value
+        if var in self._rows:
+            var.value = value
             self._save_env_file()
 
-    def _delete_variable(self, idx):
-        """Delete a variable."""
-        if idx < len(self._variables):
-            del self._variables[idx]
-            self._save_env_file()
-            self._rebuild_variables_list()
+    def _delete_variable(self, var):
+        """Delete a variable and drop its row without rebuilding the list."""
+        row = self._rows.pop(var, None)
+        if row is None:
+            return
+        self._variables.remove(var)
+        self._save_env_file()
+        found, index = self._variables_panel.children.index_of(row)
+        if found:
+            self._variables_panel.children.remove_at(index)
 
     def _add_variable(self):
         """Add a new empty variable."""
-        self._variables.append(["", "", True])
+        self._variables.append(EnvVariable("", "", True))
         self._save_env_file()
         self._rebuild_variables_list()
 
     def _add_common_variable(self, name, default_value):
         """Add a common variable."""
-        if any(v[0] == name for v in self._variables):
+        if any(v.name == name for v in self._variables):
             return
-        self._variables.append([name, default_value, True])
+        self._variables.append(EnvVariable(name, default_value, True))
         self._save_env_file()
         self.show()  # Refresh to update common vars buttons
 
@@ -61,10 +61,7 @@ class GlobalSettingsPage:
                 off_text,
             )
 
-            behavior_panel.children.append(watch_stylesheet)
-            behavior_panel.children.append(watch_config)
-            behavior_panel.children.append(debug_mode)
-            behavior_panel.children.append(update_check)
+            behavior_panel.children.extend((watch_stylesheet, watch_config, debug_mode, update_check))
             behavior_expander.content = behavior_panel
             main_panel.children.append(behavior_expander)
 
@@ -77,9 +74,7 @@ class GlobalSettingsPage:
             komorebi_stop = self._ui.create_textbox(t("global_komorebi_stop"), komorebi.get("stop_command", ""))
             komorebi_reload = self._ui.create_textbox(t("global_komorebi_reload"), komorebi.get("reload_command", ""))
 
-            komorebi_panel.children.append(komorebi_start)
-            komorebi_panel.children.append(komorebi_stop)
-            komorebi_panel.children.append(komorebi_reload)
+            komorebi_panel.children.extend((komorebi_start, komorebi_stop, komorebi_reload))
             komorebi_expander.content = komorebi_panel
             main_panel.children.append(komorebi_expander)
 
@@ -92,9 +87,7 @@ class GlobalSettingsPage:
             glazewm_stop = self._ui.create_textbox(t("global_glazewm_stop"), glazewm.get("stop_command", ""))
             glazewm_reload = self._ui.create_textbox(t("global_glazewm_reload"), glazewm.get("reload_command", ""))
 
-            glazewm_panel.children.append(glazewm_start)
-            glazewm_panel.children.append(glazewm_stop)
-            glazewm_panel.children.append(glazewm_reload)
+            glazewm_panel.children.extend((glazewm_start, glazewm_stop, glazewm_reload))
             glazewm_expander.content = glazewm_panel
             main_panel.children.append(glazewm_expander)
 
@@ -108,8 +101,7 @@ class GlobalSettingsPage:
             config_path = self._ui.create_path_text(config_path_text)
             styles_path = self._ui.create_path_text(styles_path_text)
 
-            paths_panel.children.append(config_path)
-            paths_panel.children.append(styles_path)
+            paths_panel.children.extend((config_path, styles_path))
             paths_expander.content = paths_panel
             main_panel.children.append(paths_expander)
 
@@ -9,16 +9,15 @@ import subprocess
 import time
 import webbrowser
 from ctypes import WinError
+from functools import partial
 
-from core.code_editor import get_code_editor_html_uri
-from core.constants import WEBVIEW_CACHE_DIR
+from core.code_editor import get_code_editor_html_uri, get_css_tools_script, get_webview_environment
 from core.editor.editor_context_menu import monaco_context_menu
 from core.localization import t
 from core.logger import error
 from core.preferences import get_preferences
 from ui.controls import UIFactory
 from ui.loader import load_xaml
-from webview2.microsoft.web.webview2.core import CoreWebView2Environment
 from winrt.windows.foundation import AsyncStatus, IAsyncAction, IAsyncOperation, Uri
 from winrt.windows.ui import Color
 from winui3.microsoft.ui.xaml import FrameworkElement, Visibility
@@ -26,6 +25,10 @@ from winui3.microsoft.ui.xaml.controls import ContentDialogButton, FontIcon, Gri
 from winui3.microsoft.ui.xaml.markup import XamlReader
 
 
+def _open_in_notepad(args, sender, event):
+    subprocess.Popen(args)
+
+
 class StylesPage:
     """Manages styles editor with Monaco."""
 
@@ -33,10 +36,18 @@ class StylesPage:
         self._app = app
         self._config_manager = app._config_manager
         self._ui = UIFactory()
+        self._page = None  # Built on first show and reused afterwards
         self._webview = None
         self._editor_ready = False
         self._pending_content = None
+        self._last_content = ""
         self._loader_start_time = None
+        self._notepad_args = ["notepad", self._config_manager.styles_path]
+        self._msg_handlers = {
+            "ready": self._handle_ready,
+            "initialized": self._handle_initialized,
+            "contentChanged": self._handle_content_changed,
+        }
 
     def _create_icon(self, glyph_entity):
         xaml = f'''<FontIcon xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
@@ -46,6 +57,15 @@ class StylesPage:
     def show(self):
         """Display styles editor page."""
         try:
+            if self._page is not None:
+                # Keep the loaded Monaco instance (and any unsaved buffer) across navigation
+                self._app._content_area.content = self._page
+                if not self._app._unsaved_styles:
+                    self._reload_if_changed_on_disk()
+                if self._editor_ready:
+                    self._webview.execute_script_async("if (editor) editor.focus();")
+                return
+
             page = XamlReader.load(load_xaml("pages/StylesPage.xaml")).as_(Page)
             content = page.content.as_(FrameworkElement)
 
@@ -57,28 +77,22 @@ class StylesPage:
             page_title.text = t("styles_title")
 
             open_btn = self._ui.create_button(t("common_open_editor"))
-            open_btn.add_click(lambda s, e: subprocess.Popen(["notepad", self._config_manager.styles_path]))
+            open_btn.add_click(partial(_open_in_notepad, self._notepad_args))
             header_panel.children.append(open_btn)
 
             css_content = self._config_manager.load_styles()
             self._pending_content = css_content
+            self._last_content = css_content
 
-            prefs = get_preferences()
-            self._editor_font = prefs.get("editor_font", "Cascadia Code") if prefs else "Cascadia Code"
-            self._editor_font_size = prefs.get("editor_font_size", 13) if prefs else 13
-
-            editor_theme = prefs.get("editor_theme", "auto") if prefs else "auto"
+            prefs = get_preferences() or {}
+            self._editor_font = prefs.get("editor_font", "Cascadia Code")
+            self._editor_font_size = prefs.get("editor_font_size", 13)
 
+            editor_theme = prefs.get("editor_theme", "auto")
             if editor_theme == "auto":
-                app_theme = prefs.get("theme", "default") if prefs else "default"
-                if app_theme == "light":
-                    self._monaco_theme = "light"
-                elif app_theme == "dark":
-                    self._monaco_theme = "dark"
-                else:
-                    self._monaco_theme = "dark"
-            else:
-                self._monaco_theme = editor_theme
+                # Follow the app theme; "default" resolves to dark
+                editor_theme = "light" if prefs.get("theme", "default") == "light" else "dark"
+            self._monaco_theme = editor_theme
 
             self._webview.add_web_message_received(self._on_web_message)
             self._webview.add_navigation_completed(self._on_navigation_completed)
@@ -86,93 +100,75 @@ class StylesPage:
             self._init_webview()
 
             self._app._content_area.content = page
+            self._page = page
         except Exception as e:
             error(f"Styles page error: {e}", exc_info=True)
 
+    def _reload_if_changed_on_disk(self):
+        """Pick up styles.css edits made outside the app while the page was cached."""
+        css_content = self._config_manager.load_styles()
+        if css_content == self._last_content:
+            return
+        self._last_content = css_content
+        if self._pending_content is not None:
+            # Monaco has not been initialized yet, so it will load this content on init
+            self._pending_content = css_content
+            return
+        message = {"action": "setContent", "content": css_content}
+        self._webview.core_webview2.post_web_message_as_json(json.dumps(message))
+
     def _init_webview(self):
         """Initialize WebView2 with async pattern."""
-        self._loader_start_time = time.time()
-
-        # Create WebView2 environment with shared cache dir
-        env_op = CoreWebView2Environment.create_with_options_async("", WEBVIEW_CACHE_DIR, None)
-
-        def on_env_created(op: IAsyncOperation, status: AsyncStatus):
-            if status == AsyncStatus.ERROR:
-                error(f"WebView2 environment creation failed: {WinError(op.error_code.value)}")
-                self._show_webview2_missing_dialog()
-                return
-            if status != AsyncStatus.COMPLETED:
-                return
-
-            env = op.get_results()
-            ensure_op = self._webview.ensure_core_webview2_with_environment_async(env)
-
-            def on_ensure_complete(ensure_op_inner: IAsyncAction, ensure_status: AsyncStatus):
-                if ensure_status == AsyncStatus.ERROR:
-                    error(f"WebView2 ensure failed: {WinError(ensure_op_inner.error_code.value)}")
-                    return
-                if ensure_status != AsyncStatus.COMPLETED:
-                    return
-
-                self._webview.default_background_color = Color(a=255, r=25, g=26, b=28)
-
-                css_extra_items = [
-                    (
-                        t("common_format_css"),
-                        "&#xE943;",  # AlignLeft icon
-                        """if(window.editor){
-                            var css = editor.getValue();
-                            var formatted = '';
-                            var indent = 0;
-                            var inRule = false;
-                            
-                            // Remove existing formatting
-                            css = css.replace(/\\s+/g, ' ').trim();
-                            
-                            for (var i = 0; i < css.length; i++) {
-                                var c = css[i];
-                                if (c === '{') {
-                                    formatted += ' {\\n' + '  '.repeat(indent + 1);
-                                    indent++;
-                                    inRule = true;
-                                } else if (c === '}') {
-                                    indent--;
-                                    formatted = formatted.trimEnd() + '\\n' + '  '.repeat(indent) + '}\\n' + (indent === 0 ? '\\n' : '');
-                                    inRule = false;
-                                } else if (c === ';' && inRule) {
-                                    formatted += ';\\n' + '  '.repeat(indent);
-                                } else if (c === ',' && !inRule) {
-                                    // Multiple selectors - put each on new line
-                                    formatted += ',\\n';
-                                } else if (c === ' ' && (formatted.endsWith('\\n' + '  '.repeat(indent)) || formatted.endsWith(',\\n'))) {
-                                    // Skip leading space after newline
-                                } else {
-                                    formatted += c;
-                                }
-                            }
-                            editor.setValue(formatted.trim());
-                        }""",
-                    ),
-                    (
-                        t("common_cleanup_css"),
-                        "&#xEA99;",  # Broom icon
-                        """if(window.editor){
-                            var content = editor.getValue();
-                            // Remove block comments /* ... */
-                            content = content.replace(/\\/\\*[\\s\\S]*?\\*\\//g, '');
-                            editor.setValue(content);
-                        }""",
-                    ),
-                ]
-
-                monaco_context_menu(self._webview, self._create_icon, t, css_extra_items)
-
-                html_uri = get_code_editor_html_uri()
-                self._webview.source = Uri(html_uri)
-
-            ensure_op.completed = on_ensure_complete
-
-        env_op.completed = on_env_created
+        self._loader_start_time = time.perf_counter_ns()
+        # WebView2 environment is shared across editors and created on first use
+        get_webview_environment(self._on_env_created)
+
+    def _on_env_created(self, env, env_error):
+        """Attach the shared WebView2 environment to the editor control."""
+        if env_error is not None:
+            error(f"WebView2 environment creation failed: {env_error}")
+            self._show_webview2_missing_dialog()
+            return
+        if env is None:
+            return
+
+        ensure_op = self._webview.ensure_core_webview2_with_environment_async(env)
+        ensure_op.completed = self._on_ensure_complete
+
+    def _on_ensure_complete(self, ensure_op: IAsyncAction, ensure_status: AsyncStatus):
+        """Set up the context menu and CSS helpers once CoreWebView2 exists."""
+        if ensure_status == AsyncStatus.ERROR:
+            error(f"WebView2 ensure failed: {WinError(ensure_op.error_code.value)}")
+            return
+        if ensure_status != AsyncStatus.COMPLETED:
+            return
+
+        self._webview.default_background_color = Color(a=255, r=25, g=26, b=28)
+
+        css_extra_items = [
+            (
+                t("common_format_css"),
+                "&#xE943;",  # AlignLeft icon
+                "if(window.__yasbFormatCss)window.__yasbFormatCss();",
+            ),
+            (
+                t("common_cleanup_css"),
+                "&#xEA99;",  # Broom icon
+                "if(window.__yasbCleanupCss)window.__yasbCleanupCss();",
+            ),
+        ]
+
+        monaco_context_menu(self._webview, self._create_icon, t, css_extra_items)
+
+        # Register the CSS helpers before navigating so they exist in the editor document
+        script_op = self._webview.core_webview2.add_script_to_execute_on_document_created_async(get_css_tools_script())
+        script_op.completed = self._on_script_added
+
+    def _on_script_added(self, script_op: IAsyncOperation, script_status: AsyncStatus):
+        """Navigate to the editor page after the CSS helpers are registered."""
+        if script_status == AsyncStatus.ERROR:
+            error(f"CSS tools script injection failed: {WinError(script_op.error_code.value)}")
+        self._webview.source = Uri(get_code_editor_html_uri())
 
     def _on_navigation_completed(self, sender, args):
         """Called when WebView2 navigation is complete."""
@@ -182,25 +178,36 @@ class StylesPage:
         """Handle messages from Monaco editor."""
         try:
             msg = json.loads(args.web_message_as_json)
-            if msg.get("type") == "ready":
-                self._editor_ready = True
-                self._init_editor_content()
-            elif msg.get("type") == "initialized":
-                self._loading_overlay.visibility = Visibility.COLLAPSED
-                self._webview.visibility = Visibility.VISIBLE
-            elif msg.get("type") == "contentChanged":
-                content = msg.get("content", "")
-                self._app.mark_unsaved("styles", current_styles=content)
+            handler = self._msg_handlers.get(msg.get("type"))
+            if handler:
+                handler(msg)
         except Exception as e:
             error(f"Web message error: {e}")
 
+    def _handle_ready(self, msg):
+        self._editor_ready = True
+        self._init_editor_content()
+
+    def _handle_initialized(self, msg):
+        self._loading_overlay.visibility = Visibility.COLLAPSED
+        self._webview.visibility = Visibility.VISIBLE
+
+    def _handle_content_changed(self, msg):
+        content = msg.get("content")
+        if content is None:
+            # Dirty signal ahead of the debounced snapshot
+            self._app.mark_unsaved("styles")
+            return
+        self._last_content = content
+        self._app.mark_unsaved("styles", current_styles=content)
+
     def _init_editor_content(self):
         """Initialize editor with content after Monaco is ready."""
         try:
-            elapsed = time.time() - self._loader_start_time if self._loader_start_time else 0
-            elapsed_ms = int(elapsed * 1000)
+            elapsed_ms = (time.perf_counter_ns() - self._loader_start_time) // 1_000_000
 
             init_options = {
+                "action": "init",
                 "theme": self._monaco_theme,
                 "language": "css",
                 "fontFamily": self._editor_font,
@@ -209,26 +216,42 @@ class StylesPage:
                 "focus": True,
                 "elapsedMs": elapsed_ms,
                 "minTotalMs": 1000,
+                "contentChangedDelay": 250,
             }
 
-            js_options = json.dumps(init_options)
-            self._webview.execute_script_async(f"initEditor({js_options})")
+            # Posted as a web message so the CSS never has to be parsed as a script literal
+            self._webview.core_webview2.post_web_message_as_json(json.dumps(init_options))
             self._pending_content = None
 
             self._app._styles_webview = self._webview
         except Exception as e:
             error(f"Init editor content error: {e}")
 
-    async def get_content(self):
-        """Get CSS content from Monaco editor."""
-        try:
-            if self._webview and self._editor_ready:
-                result = await self._webview.execute_script_async("getContent()")
-                if result:
-                    return json.loads(result)
-        except Exception as e:
-            error(f"Get content error: {e}")
-        return ""
+    def read_editor_content(self, callback):
+        """Flush the editor's pending snapshot and pass the live buffer to callback on the UI thread.
+
+        callback receives None if the editor could not be read.
+        """
+        dispatcher = self._webview.dispatcher_queue
+
+        def on_content(op: IAsyncOperation, status: AsyncStatus):
+            def finish():
+                content = None
+                if status == AsyncStatus.COMPLETED:
+                    value = json.loads(op.get_results() or "null")
+                    if isinstance(value, str):
+                        content = value
+                        self._last_content = value
+                else:
+                    error(f"Reading styles editor content failed: {status}")
+                callback(content)
+
+            if dispatcher and dispatcher.try_enqueue(finish):
+                return
+            finish()
+
+        script = "window.__yasbFlushContent ? window.__yasbFlushContent() : null"
+        self._webview.execute_script_async(script).completed = on_content
 
     def _show_webview2_missing_dialog(self):
         """Show dialog when WebView2 runtime is not found."""
@@ -9,6 +9,9 @@ import re
 import time
 import webbrowser
 from ctypes import WinError
+from datetime import timedelta
+from functools import lru_cache
+from operator import itemgetter
 from types import SimpleNamespace
 
 from core.code_editor import (
@@ -16,8 +19,8 @@ from core.code_editor import (
     fix_yaml_indentation,
     format_yaml,
     get_code_editor_html_uri,
+    get_webview_environment,
 )
-from core.constants import WEBVIEW_CACHE_DIR
 from core.editor.editor_context_menu import monaco_context_menu
 from core.localization import t
 from core.logger import error, warning
@@ -36,10 +39,9 @@ from core.widget_helpers import (
 )
 from ui.controls import UIFactory
 from ui.loader import load_xaml
-from webview2.microsoft.web.webview2.core import CoreWebView2Environment
 from winrt.windows.foundation import AsyncStatus, IAsyncAction, IAsyncOperation, Uri
 from winrt.windows.ui import Color
-from winui3.microsoft.ui.xaml import FocusState, FrameworkElement, Thickness, Visibility
+from winui3.microsoft.ui.xaml import DispatcherTimer, FocusState, FrameworkElement, Thickness, Visibility
 from winui3.microsoft.ui.xaml.controls import (
     Border,
     Button,
@@ -63,41 +65,151 @@ from winui3.microsoft.ui.xaml.media import TranslateTransform
 from winui3.microsoft.ui.xaml.media.animation import Storyboard
 
 
+@lru_cache(maxsize=None)
+def _escaped_t(key):
+    """Translated, XML-escaped dialog string (the language is fixed until restart)."""
+    return UIFactory.escape_xml(t(key))
+
+
+_POSITIONS = ("left", "center", "right")
+# (position, title key, description key) for the section expanders
+_POSITION_META = (
+    ("left", "widgets_left", "widgets_left_desc"),
+    ("center", "widgets_center", "widgets_center_desc"),
+    ("right", "widgets_right", "widgets_right_desc"),
+)
+
+
+def _icon_xaml(glyph_entity):
+    return (
+        '<FontIcon xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" '
+        f'Glyph="{glyph_entity}" FontFamily="Segoe Fluent Icons"/>'
+    )
+
+
+# FontIcon markup per glyph, prebuilt for the menu glyphs; each icon still needs its own parsed element
+_ICON_XAML_CACHE: dict[str, str] = {
+    glyph: _icon_xaml(glyph)
+    for glyph in (
+        "&#xE70F;",  # Edit
+        "&#xE710;",  # Add
+        "&#xE711;",  # Disable
+        "&#xE72A;",  # Forward
+        "&#xE72B;",  # Back
+        "&#xE74A;",  # Up
+        "&#xE74B;",  # Down
+        "&#xE74D;",  # Delete
+        "&#xE8AC;",  # Rename
+        "&#xE8C8;",  # Duplicate
+        "&#xE8E3;",  # Align center
+    )
+}
+
+# Slide animation for up/down moves; formatted with the Y offset
+_MOVE_STORYBOARD_XAML = (
+    '<Storyboard xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation">'
+    '<DoubleAnimation Storyboard.TargetProperty="Y" To="{}" Duration="0:0:0.2"/></Storyboard>'
+)
+
+# Widget names: only letters, numbers, underscore, hyphen
+_VALID_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+# Location prefix of parse_yaml errors, used to mark the line in the editor
+_ERR_LOC_RE = re.compile(r"Line (\d+), Column (\d+):")
+
+_registry_cache = {"mtime_ns": None, "registry": {}}
+
+
 def get_widget_registry():
-    """Load widget registry from JSON."""
+    """Load widget registry from JSON (re-parsed only when the file changes)."""
     from core.constants import REGISTRY_FILE
 
     path = REGISTRY_FILE
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _registry_cache["mtime_ns"] == mtime_ns:
+        return _registry_cache["registry"]
+
     registry = {}
-    if path.exists():
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                widgets_data = data.get("widgets", {})
-                for key, val in widgets_data.items():
-                    registry[key] = SimpleNamespace(**val)
-        except Exception as e:
-            error(f"Failed to load registry: {e}")
+    try:
+        # json detects UTF-8 from bytes, skipping the text-mode reader
+        data = json.loads(path.read_bytes())
+        widgets_data = data.get("widgets", {})
+        for key, val in widgets_data.items():
+            registry[key] = SimpleNamespace(**val)
+    except Exception as e:
+        error(f"Failed to load registry: {e}")
+        return registry
+    _registry_cache["mtime_ns"] = mtime_ns
+    _registry_cache["registry"] = registry
     return registry
 
 
 class WidgetsPage:
     """Manages widgets configuration with card sections and context menu."""
 
+    _MOVE_ICONS = {
+        "left": "&#xE72B;",  # Back arrow
+        "center": "&#xE8E3;",  # Align center
+        "right": "&#xE72A;",  # Forward arrow
+    }
+
     def __init__(self, app):
         self._app = app
         self._config_manager = app._config_manager
         self._ui = UIFactory()
         self._add_widget_data = None
-        self._widget_registry = get_widget_registry()
+        self._widget_registry = {}
+        self._registry_by_type_path = {}
+        self.reload_registry()
         self._sections_panel = None
         self._widget_panels = {}
         self._section_expanders = {}  # Store expanders by position
         self._disabled_widgets_panel = None
+        self._bar_names = ()  # Bar names in selector order
+        self._disabled_expander = None
+        self._disabled_menu = None  # Context menu shared by all disabled rows
+        self._disabled_loaded = False  # Disabled rows are built on first expand
+        self._position_menus = {}  # One row context menu per position, shared by its rows
+        self._menu_widget_name = None  # Widget the open row menu belongs to
+        self._labels = {}
+        self._pos_labels = {}
+        self._add_to_labels = {}
+        self._move_to_labels = {}
+
+    def _cache_labels(self):
+        """Translate the per-row menu labels once per page build (language changes need a restart)."""
+        self._labels = {
+            key: t(key)
+            for key in (
+                "widgets_add",
+                "widgets_edit",
+                "widgets_rename",
+                "widgets_delete",
+                "widgets_duplicate",
+                "widgets_disable",
+                "widgets_move_up",
+                "widgets_move_down",
+            )
+        }
+        self._pos_labels = {pos: t(title_key) for pos, title_key, _ in _POSITION_META}
+        add_to, move_to = t("widgets_add_to"), t("widgets_move_to")
+        self._add_to_labels = {pos: f"{add_to} {label}" for pos, label in self._pos_labels.items()}
+        self._move_to_labels = {pos: f"{move_to} {label}" for pos, label in self._pos_labels.items()}
 
     def reload_registry(self):
         """Reload widget registry from disk."""
-        self._widget_registry = get_widget_registry()
+        registry = get_widget_registry()
+        if registry is self._widget_registry:
+            return
+        self._widget_registry = registry
+        # First entry wins for a type path, matching the old linear scan
+        by_type_path = {}
+        for info in self._widget_registry.values():
+            by_type_path.setdefault(info.type_path, info)
+        self._registry_by_type_path = by_type_path
+        self._add_widget_data = None
 
     def show(self):
         """Display widgets configuration page."""
@@ -117,23 +229,18 @@ class WidgetsPage:
             add_widget_text.text = t("widgets_add")
             add_widget_button.add_click(lambda s, e: self._show_add_widget_dialog(None))
 
+            self._cache_labels()
             self._create_sections()
 
             bars = self._config_manager.get_bars()
-            bar_names = list(bars.keys())
+            self._bar_names = tuple(bars)
 
-            for bar_name in bar_names:
+            for bar_name in self._bar_names:
                 bar_selector.items.append(self._ui.create_combobox_item(bar_name))
 
-            self._app._widgets_selected_bar = bar_names[0] if bar_names else None
-
-            def on_bar_selected(sender, e):
-                idx = bar_selector.selected_index
-                if 0 <= idx < len(bar_names):
-                    self._app._widgets_selected_bar = bar_names[idx]
-                    self._load_widgets()
+            self._app._widgets_selected_bar = self._bar_names[0] if self._bar_names else None
 
-            bar_selector.add_selection_changed(on_bar_selected)
+            bar_selector.add_selection_changed(self._on_bar_selected)
             self._setup_widget_data()
 
             if bar_selector.items.size > 0:
@@ -144,22 +251,23 @@ class WidgetsPage:
         except Exception as e:
             error(f"Widgets page error: {e}", exc_info=True)
 
+    def _on_bar_selected(self, sender, e):
+        idx = sender.as_(ComboBox).selected_index
+        if 0 <= idx < len(self._bar_names):
+            self._app._widgets_selected_bar = self._bar_names[idx]
+            self._load_widgets()
+
     def _create_icon(self, glyph_entity):
         """Create a FontIcon using a glyph entity (e.g., &#xE710;)."""
-        xaml = f'''<FontIcon xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                      Glyph="{glyph_entity}" FontFamily="Segoe Fluent Icons"/>'''
+        xaml = _ICON_XAML_CACHE.get(glyph_entity)
+        if xaml is None:
+            xaml = _ICON_XAML_CACHE[glyph_entity] = _icon_xaml(glyph_entity)
         return XamlReader.load(xaml).as_(FontIcon)
 
     def _create_sections(self):
         """Create expander sections for Left, Center, Right positions."""
-        positions = [
-            ("left", t("widgets_left"), t("widgets_left_desc")),
-            ("center", t("widgets_center"), t("widgets_center_desc")),
-            ("right", t("widgets_right"), t("widgets_right_desc")),
-        ]
-
-        for pos_key, title, desc in positions:
-            section = self._ui.create_expander(title, desc)
+        for pos_key, _, desc_key in _POSITION_META:
+            section = self._ui.create_expander(self._pos_labels[pos_key], t(desc_key))
 
             widgets_container = self._ui.create_stack_panel(spacing=4)
             section.content = widgets_container
@@ -173,6 +281,7 @@ class WidgetsPage:
             section.context_flyout = menu
 
             self._widget_panels[pos_key] = widgets_container
+            self._position_menus[pos_key] = self._create_widget_context_menu(pos_key)
             self._section_expanders[pos_key] = section
             self._sections_panel.children.append(section)
 
@@ -181,6 +290,10 @@ class WidgetsPage:
 
         self._disabled_widgets_panel = self._ui.create_stack_panel(spacing=4)
         disabled_expander.content = self._disabled_widgets_panel
+        disabled_expander.add_expanding(self._on_disabled_expanding)
+        self._disabled_menu = self._create_disabled_widget_context_menu()
+        self._disabled_expander = disabled_expander
+        self._disabled_loaded = False
 
         self._sections_panel.children.append(disabled_expander)
 
@@ -195,134 +308,154 @@ class WidgetsPage:
             if not bar:
                 return
 
-            widgets_data = bar.get("widgets", {})
+            by_position, active_widgets = self._collect_bar_layout(bar)
 
-            for position in ["left", "center", "right"]:
+            for position, widget_list in by_position.items():
                 container = self._widget_panels.get(position)
                 if not container:
                     continue
 
-                container.children.clear()
-                widget_list = widgets_data.get(position) or []
-
                 if not widget_list:
                     empty_text = self._ui.create_text_block(t("widgets_empty_hint"), None)
                     empty_text.opacity = 0.6
+                    container.children.clear()
                     container.children.append(empty_text)
                     continue
 
-                for idx, widget_name in enumerate(widget_list):
-                    item = self._create_widget_item(widget_name, position, idx, len(widget_list))
-                    container.children.append(item)
+                # Build rows first, then swap them in with one clear + extend
+                total = len(widget_list)
+                items = [
+                    self._create_widget_item(widget_name, position, idx, total)
+                    for idx, widget_name in enumerate(widget_list)
+                ]
+                container.children.clear()
+                container.children.extend(items)
 
-            # Load disabled widgets (widgets in config but not in any bar position)
-            self._load_disabled_widgets(bar)
+            # Disabled widgets (in config but not in any bar position) are only built while visible
+            if self._disabled_expander and self._disabled_expander.is_expanded:
+                self._load_disabled_widgets(active_widgets)
+            elif self._disabled_loaded:
+                self._disabled_widgets_panel.children.clear()
+                self._disabled_loaded = False
 
         except Exception as e:
             error(f"Load widgets error: {e}", exc_info=True)
 
-    def _load_disabled_widgets(self, bar):
+    def _on_disabled_expanding(self, sender, args):
+        """Build the disabled widget rows the first time the section is opened for this bar."""
+        if self._disabled_loaded:
+            return
+        bar_name = self._app._widgets_selected_bar
+        bar = self._config_manager.get_bar(bar_name) if bar_name else None
+        if bar:
+            self._load_disabled_widgets(self._collect_bar_layout(bar)[1])
+
+    @staticmethod
+    def _collect_bar_layout(bar):
+        """Return ({position: widget names}, set of every widget placed on the bar)."""
+        widgets_data = bar.get("widgets", {})
+        by_position = {position: widgets_data.get(position) or [] for position in _POSITIONS}
+        return by_position, set().union(*by_position.values())
+
+    def _load_disabled_widgets(self, active_widgets):
         """Load widgets that exist in config but are not in the current bar."""
         if not self._disabled_widgets_panel:
             return
-
-        self._disabled_widgets_panel.children.clear()
-
-        widgets_data = bar.get("widgets", {})
-        active_widgets = set()
-        for position in ["left", "center", "right"]:
-            for widget_name in widgets_data.get(position) or []:
-                active_widgets.add(widget_name)
+        self._disabled_loaded = True
 
         all_widgets = self._config_manager.get_widgets() or {}
 
-        disabled_widgets = [name for name in all_widgets.keys() if name not in active_widgets]
+        disabled_widgets = [name for name in all_widgets if name not in active_widgets]
 
         if not disabled_widgets:
             empty_text = self._ui.create_text_block(t("widgets_disabled_empty"), None)
             empty_text.opacity = 0.6
+            self._disabled_widgets_panel.children.clear()
             self._disabled_widgets_panel.children.append(empty_text)
             return
 
-        for widget_name in disabled_widgets:
-            item = self._create_disabled_widget_item(widget_name)
-            self._disabled_widgets_panel.children.append(item)
+        items = [self._create_disabled_widget_item(widget_name) for widget_name in disabled_widgets]
+        self._disabled_widgets_panel.children.clear()
+        self._disabled_widgets_panel.children.extend(items)
 
     def _create_disabled_widget_item(self, widget_name):
         """Create a disabled widget item with dimmed appearance."""
         widget = self._config_manager.get_widget(widget_name)
         widget_type = widget.get("type", "unknown") if widget else "unknown"
 
-        category = "Unknown"
-        description = ""
-        for wid, info in self._widget_registry.items():
-            if info.type_path == widget_type:
-                category = info.category
-                description = info.description
-                break
+        info = self._registry_by_type_path.get(widget_type)
+        category, description = (info.category, info.description) if info else ("Unknown", "")
 
         subtext = f"{category} · {description}" if description else category
 
         btn_xaml = f'''<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+                        xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
                         HorizontalAlignment="Stretch" HorizontalContentAlignment="Left"
                         Padding="12,8" Opacity="0.7">
             <StackPanel Spacing="2">
-                <TextBlock Text="{UIFactory.escape_xml(widget_name)}" FontWeight="SemiBold"/>
+                <TextBlock x:Name="NameText" Text="{UIFactory.escape_xml(widget_name)}" FontWeight="SemiBold"/>
                 <TextBlock Text="{UIFactory.escape_xml(subtext)}" FontSize="11" Opacity="0.6" TextWrapping="Wrap"/>
             </StackPanel>
         </Button>'''
         btn = XamlReader.load(btn_xaml).as_(Button)
 
-        menu = self._create_disabled_widget_context_menu(widget_name)
-        btn.context_flyout = menu
-
-        btn.add_click(lambda s, e, name=widget_name: self._show_edit_widget_dialog(name, None))
+        btn.context_flyout = self._disabled_menu
+        btn.add_click(self._on_disabled_widget_click)
 
         return btn
 
-    def _create_disabled_widget_context_menu(self, widget_name):
-        """Create context menu for a disabled widget."""
+    @staticmethod
+    def _row_widget_name(element):
+        """Widget name shown by a row (both row templates name the label NameText)."""
+        return element.find_name("NameText").as_(TextBlock).text
+
+    def _on_disabled_widget_click(self, sender, args):
+        self._show_edit_widget_dialog(self._row_widget_name(sender.as_(Button)), None)
+
+    def _create_disabled_widget_context_menu(self):
+        """Create the context menu shared by every disabled widget row."""
         menu = MenuFlyout()
 
+        labels = self._labels
+
         # Add to position options
-        move_icons = {
-            "left": "&#xE72B;",
-            "center": "&#xE8E3;",
-            "right": "&#xE72A;",
-        }
-        for pos_key, pos_label in [
-            ("left", t("widgets_left")),
-            ("center", t("widgets_center")),
-            ("right", t("widgets_right")),
-        ]:
+        for pos_key, add_label in self._add_to_labels.items():
             add_item = MenuFlyoutItem()
-            add_item.text = f"{t('widgets_add_to')} {pos_label}"
-            add_item.icon = self._create_icon(move_icons.get(pos_key, "&#xE710;"))
-            add_item.add_click(lambda s, e, p=pos_key, n=widget_name: self._enable_widget(n, p))
+            add_item.text = add_label
+            add_item.icon = self._create_icon(self._MOVE_ICONS[pos_key])
+            add_item.add_click(lambda s, e, p=pos_key: self._enable_widget(self._menu_widget_name, p))
             menu.items.append(add_item)
 
         menu.items.append(MenuFlyoutSeparator())
 
         edit_item = MenuFlyoutItem()
-        edit_item.text = t("widgets_edit")
+        edit_item.text = labels["widgets_edit"]
         edit_item.icon = self._create_icon("&#xE70F;")
-        edit_item.add_click(lambda s, e: self._show_edit_widget_dialog(widget_name, None))
+        edit_item.add_click(lambda s, e: self._show_edit_widget_dialog(self._menu_widget_name, None))
         menu.items.append(edit_item)
 
         rename_item = MenuFlyoutItem()
-        rename_item.text = t("widgets_rename")
+        rename_item.text = labels["widgets_rename"]
         rename_item.icon = self._create_icon("&#xE8AC;")
-        rename_item.add_click(lambda s, e: self._show_rename_widget_dialog(widget_name))
+        rename_item.add_click(lambda s, e: self._show_rename_widget_dialog(self._menu_widget_name))
         menu.items.append(rename_item)
 
         delete_item = MenuFlyoutItem()
-        delete_item.text = t("widgets_delete")
+        delete_item.text = labels["widgets_delete"]
         delete_item.icon = self._create_icon("&#xE74D;")
-        delete_item.add_click(lambda s, e: self._delete_disabled_widget(widget_name))
+        delete_item.add_click(lambda s, e: self._delete_disabled_widget(self._menu_widget_name))
         menu.items.append(delete_item)
 
+        menu.add_opening(lambda s, e: self._on_disabled_menu_opening(menu))
         return menu
 
+    def _on_disabled_menu_opening(self, menu):
+        """Point the shared disabled-widget menu at the row it opened on."""
+        try:
+            self._menu_widget_name = self._row_widget_name(menu.target)
+        except Exception as e:
+            error(f"Widget menu error: {e}", exc_info=True)
+
     def _enable_widget(self, widget_name, position):
         """Enable a widget by adding it to a bar position."""
         if enable_widget(self._config_manager, self._app._widgets_selected_bar, widget_name, position):
@@ -340,135 +473,251 @@ class WidgetsPage:
         widget = self._config_manager.get_widget(widget_name)
         widget_type = widget.get("type", "unknown") if widget else "unknown"
 
-        category, description = "Unknown", ""
-        for wid, info in self._widget_registry.items():
-            if info.type_path == widget_type:
-                category, description = info.category, info.description
-                break
+        info = self._registry_by_type_path.get(widget_type)
+        category, description = (info.category, info.description) if info else ("Unknown", "")
 
         container = XamlReader.load(load_xaml("components/WidgetItemRow.xaml")).as_(Grid)
         container.find_name("NameText").as_(TextBlock).text = widget_name
         container.find_name("SubText").as_(TextBlock).text = f"{category} · {description}" if description else category
+        container.find_name("MainButton").as_(Button).context_flyout = self._position_menus[position]
 
-        main_btn = container.find_name("MainButton").as_(Button)
+        # Looked up once here and handed to _update_move_buttons
         up_btn = container.find_name("UpButton").as_(Button)
         down_btn = container.find_name("DownButton").as_(Button)
 
-        main_btn.context_flyout = self._create_widget_context_menu(widget_name, position, index, total)
+        # The row looks up its current index on click, so it stays valid after an in-place swap
+        up_btn.add_click(lambda s, e: self._animate_and_move_widget(widget_name, position, -1, container))
+        down_btn.add_click(lambda s, e: self._animate_and_move_widget(widget_name, position, 1, container))
 
-        up_btn.add_click(lambda s, e: self._animate_and_move_widget(widget_name, position, -1, index))
-        down_btn.add_click(lambda s, e: self._animate_and_move_widget(widget_name, position, 1, index))
+        self._update_move_buttons(up_btn, down_btn, index, total)
+        return container
 
-        if index == 0:
-            up_btn.is_enabled, up_btn.opacity = False, 0.6
-        if index == total - 1:
-            down_btn.is_enabled, down_btn.opacity = False, 0.6
+    def _update_move_buttons(self, up_btn, down_btn, index, total):
+        """Enable a row's up/down buttons according to its index in the position."""
+        up_btn.is_enabled = index > 0
+        up_btn.opacity = 1.0 if index > 0 else 0.6
+        down_btn.is_enabled = index < total - 1
+        down_btn.opacity = 1.0 if index < total - 1 else 0.6
 
-        return container
+    def _create_widget_context_menu(self, position):
+        """Create the context menu shared by every widget row in a position.
 
-    def _create_widget_context_menu(self, widget_name, position, index, total):
-        """Create context menu for a widget."""
+        The row it was opened for is resolved in _on_widget_menu_opening.
+        """
         menu = MenuFlyout()
+        labels = self._labels
 
         edit_item = MenuFlyoutItem()
-        edit_item.text = t("widgets_edit")
+        edit_item.text = labels["widgets_edit"]
         edit_item.icon = self._create_icon("&#xE70F;")
-        edit_item.add_click(lambda s, e: self._show_edit_widget_dialog(widget_name, position))
+        edit_item.add_click(lambda s, e: self._show_edit_widget_dialog(self._menu_widget_name, position))
         menu.items.append(edit_item)
 
         menu.items.append(MenuFlyoutSeparator())
 
         add_item = MenuFlyoutItem()
-        add_item.text = t("widgets_add")
+        add_item.text = labels["widgets_add"]
         add_item.icon = self._create_icon("&#xE710;")
         add_item.add_click(lambda s, e: self._show_add_widget_dialog(position))
         menu.items.append(add_item)
 
         menu.items.append(MenuFlyoutSeparator())
 
-        if index > 0:
-            up_item = MenuFlyoutItem()
-            up_item.text = t("widgets_move_up")
-            up_item.icon = self._create_icon("&#xE74A;")  # Up arrow
-            up_item.add_click(lambda s, e: self._move_widget_order(widget_name, position, -1))
-            menu.items.append(up_item)
+        up_item = MenuFlyoutItem()
+        up_item.text = labels["widgets_move_up"]
+        up_item.icon = self._create_icon("&#xE74A;")  # Up arrow
+        up_item.add_click(lambda s, e: self._move_widget_order(self._menu_widget_name, position, -1))
+        menu.items.append(up_item)
 
-        if index < total - 1:
-            down_item = MenuFlyoutItem()
-            down_item.text = t("widgets_move_down")
-            down_item.icon = self._create_icon("&#xE74B;")  # Down arrow
-            down_item.add_click(lambda s, e: self._move_widget_order(widget_name, position, 1))
-            menu.items.append(down_item)
+        down_item = MenuFlyoutItem()
+        down_item.text = labels["widgets_move_down"]
+        down_item.icon = self._create_icon("&#xE74B;")  # Down arrow
+        down_item.add_click(lambda s, e: self._move_widget_order(self._menu_widget_name, position, 1))
+        menu.items.append(down_item)
 
-        if index > 0 or index < total - 1:
-            menu.items.append(MenuFlyoutSeparator())
+        order_separator = MenuFlyoutSeparator()
+        menu.items.append(order_separator)
 
         # Move to position submenu items
-        move_icons = {
-            "left": "&#xE72B;",  # Back arrow
-            "center": "&#xE8E3;",  # Align center
-            "right": "&#xE72A;",  # Forward arrow
-        }
-        for pos_key, pos_label in [
-            ("left", t("widgets_left")),
-            ("center", t("widgets_center")),
-            ("right", t("widgets_right")),
-        ]:
+        for pos_key, move_label in self._move_to_labels.items():
             if pos_key != position:
                 move_item = MenuFlyoutItem()
-                move_item.text = f"{t('widgets_move_to')} {pos_label}"
-                move_item.icon = self._create_icon(move_icons.get(pos_key, "&#xE8FD;"))
-                move_item.add_click(lambda s, e, p=pos_key: self._move_widget(widget_name, position, p))
+                move_item.text = move_label
+                move_item.icon = self._create_icon(self._MOVE_ICONS[pos_key])
+                move_item.add_click(lambda s, e, p=pos_key: self._move_widget(self._menu_widget_name, position, p))
                 menu.items.append(move_item)
 
         menu.items.append(MenuFlyoutSeparator())
 
         duplicate_item = MenuFlyoutItem()
-        duplicate_item.text = t("widgets_duplicate")
+        duplicate_item.text = labels["widgets_duplicate"]
         duplicate_item.icon = self._create_icon("&#xE8C8;")
-        duplicate_item.add_click(lambda s, e: self._duplicate_widget(widget_name, position))
+        duplicate_item.add_click(lambda s, e: self._duplicate_widget(self._menu_widget_name, position))
         menu.items.append(duplicate_item)
 
         rename_item = MenuFlyoutItem()
-        rename_item.text = t("widgets_rename")
+        rename_item.text = labels["widgets_rename"]
         rename_item.icon = self._create_icon("&#xE8AC;")
-        rename_item.add_click(lambda s, e: self._show_rename_widget_dialog(widget_name))
+        rename_item.add_click(lambda s, e: self._show_rename_widget_dialog(self._menu_widget_name))
         menu.items.append(rename_item)
 
         disable_item = MenuFlyoutItem()
-        disable_item.text = t("widgets_disable")
+        disable_item.text = labels["widgets_disable"]
         disable_item.icon = self._create_icon("&#xE711;")
-        disable_item.add_click(lambda s, e: self._disable_widget(widget_name, position))
+        disable_item.add_click(lambda s, e: self._disable_widget(self._menu_widget_name, position))
         menu.items.append(disable_item)
 
         delete_item = MenuFlyoutItem()
-        delete_item.text = t("widgets_delete")
+        delete_item.text = labels["widgets_delete"]
         delete_item.icon = self._create_icon("&#xE74D;")
-        delete_item.add_click(lambda s, e: self._delete_widget(widget_name, position))
+        delete_item.add_click(lambda s, e: self._delete_widget(self._menu_widget_name, position))
         menu.items.append(delete_item)
 
+        menu.add_opening(lambda s, e: self._on_widget_menu_opening(menu, position, up_item, down_item, order_separator))
         return menu
 
+    def _on_widget_menu_opening(self, menu, position, up_item, down_item, order_separator):
+        """Point the shared menu at the row it opened on and show only the valid move items."""
+        try:
+            target = menu.target
+            self._menu_widget_name = self._row_widget_name(target)
+
+            container = self._widget_panels.get(position)
+            found, index = container.children.index_of(target.parent.as_(Grid))
+            total = container.children.size
+            can_move_up = found and index > 0
+            can_move_down = found and index < total - 1
+
+            up_item.visibility = Visibility.VISIBLE if can_move_up else Visibility.COLLAPSED
+            down_item.visibility = Visibility.VISIBLE if can_move_down else Visibility.COLLAPSED
+            order_separator.visibility = Visibility.VISIBLE if can_move_up or can_move_down else Visibility.COLLAPSED
+        except Exception as e:
+            error(f"Widget menu error: {e}", exc_info=True)
+
     def _move_widget_order(self, widget_name, position, direction):
         """Move widget up or down in the list."""
         if move_widget_order(self._config_manager, self._app._widgets_selected_bar, widget_name, position, direction):
             self._app.mark_unsaved()
-            self._load_widgets()
+            if not self._swap_widget_rows(widget_name, position, direction):
+                self._load_widgets()
 
-    def _animate_and_move_widget(self, widget_name, position, direction, current_index):
+    def _swap_widget_rows(self, widget_name, position, direction):
+        """Mirror a one-step move in the panel without rebuilding it. Returns False if out of sync."""
+        try:
+            container = self._widget_panels.get(position)
+            bar = self._config_manager.get_bar(self._app._widgets_selected_bar)
+            widget_list = (bar.get("widgets") or {}).get(position) if bar else None
+            if (
+                not container
+                or not widget_list
+                or widget_name not in widget_list
+                or container.children.size != len(widget_list)
+            ):
+                return False
+
+            new_index = widget_list.index(widget_name)
+            old_index = new_index - direction
+            if not 0 <= old_index < len(widget_list):
+                return False
+
+            row = container.children.get_at(old_index).as_(Grid)
+            if self._row_widget_name(row) != widget_name:
+                return False
+
+            container.children.remove_at(old_index)
+            container.children.insert_at(new_index, row)
+
+            total = len(widget_list)
+            for idx in (old_index, new_index):
+                item = container.children.get_at(idx).as_(Grid)
+                self._update_move_buttons(
+                    item.find_name("UpButton").as_(Button), item.find_name("DownButton").as_(Button), idx, total
+                )
+            return True
+        except Exception as e:
+            error(f"Swap widget rows error: {e}", exc_info=True)
+            return False
+
+    def _append_widget_row(self, widget_name, position):
+        """Add the row for a widget just appended to a position. Returns False if out of sync."""
+        try:
+            container = self._widget_panels.get(position)
+            bar = self._config_manager.get_bar(self._app._widgets_selected_bar)
+            widget_list = (bar.get("widgets") or {}).get(position) if bar else None
+            if not container or not widget_list or widget_list[-1] != widget_name:
+                return False
+
+            total = len(widget_list)
+            if total == 1:
+                # Drops the empty hint
+                container.children.clear()
+            elif container.children.size != total - 1:
+                return False
+            else:
+                # The previous last row can now move down
+                prev = container.children.get_at(total - 2).as_(Grid)
+                self._update_move_buttons(
+                    prev.find_name("UpButton").as_(Button), prev.find_name("DownButton").as_(Button), total - 2, total
+                )
+            container.children.append(self._create_widget_item(widget_name, position, total - 1, total))
+            return True
+        except Exception as e:
+            error(f"Append widget row error: {e}", exc_info=True)
+            return False
+
+    def _update_widget_row(self, old_name, new_name):
+        """Replace the rows of a renamed widget in place. Returns False if out of sync."""
+        try:
+            bar = self._config_manager.get_bar(self._app._widgets_selected_bar)
+            if not bar:
+                return False
+            by_position, active_widgets = self._collect_bar_layout(bar)
+            for position, widget_list in by_position.items():
+                if new_name not in widget_list:
+                    continue
+                container = self._widget_panels.get(position)
+                if not container or container.children.size != len(widget_list):
+                    return False
+                total = len(widget_list)
+                for idx, name in enumerate(widget_list):
+                    if name != new_name:
+                        continue
+                    if self._row_widget_name(container.children.get_at(idx).as_(Grid)) != old_name:
+                        return False
+                    # Rebuilt rather than relabelled: the row's move handlers capture the name
+                    container.children.remove_at(idx)
+                    container.children.insert_at(idx, self._create_widget_item(new_name, position, idx, total))
+
+            # A rename also moves the widget to the end of the config, so the disabled list is rebuilt
+            if self._disabled_loaded:
+                self._load_disabled_widgets(active_widgets)
+            return True
+        except Exception as e:
+            error(f"Update widget row error: {e}", exc_info=True)
+            return False
+
+    def _animate_and_move_widget(self, widget_name, position, direction, row):
         """Move widget with smooth animation."""
         container = self._widget_panels.get(position)
+        found, current_index = container.children.index_of(row) if container else (False, 0)
         target_index = current_index + direction
 
-        if not container or target_index < 0 or target_index >= container.children.size:
+        if not found or target_index < 0 or target_index >= container.children.size:
             self._move_widget_order(widget_name, position, direction)
             return
 
         try:
             current_item = container.children.get_at(current_index).as_(Grid)
             target_item = container.children.get_at(target_index).as_(Grid)
-            current_tf = current_item.find_name("ContainerTransform").as_(TranslateTransform)
-            target_tf = target_item.find_name("ContainerTransform").as_(TranslateTransform)
+
+            # Rows not laid out yet (e.g. right after a reload) have nothing to animate
+            if current_item.actual_height < 1 or target_item.actual_height < 1:
+                self._move_widget_order(widget_name, position, direction)
+                return
+
+            # ContainerTransform is the row's RenderTransform; no need to search the tree for it
+            current_tf = current_item.render_transform.as_(TranslateTransform)
+            target_tf = target_item.render_transform.as_(TranslateTransform)
 
             if not (current_tf and target_tf):
                 self._move_widget_order(widget_name, position, direction)
@@ -477,11 +726,8 @@ class WidgetsPage:
             dist1 = (target_item.actual_height + 4) * direction
             dist2 = (current_item.actual_height + 4) * -direction
 
-            def create_storyboard(to_value):
-                xaml = f'<Storyboard xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"><DoubleAnimation Storyboard.TargetProperty="Y" To="{to_value}" Duration="0:0:0.2"/></Storyboard>'
-                return XamlReader.load(xaml).as_(Storyboard)
-
-            sb1, sb2 = create_storyboard(dist1), create_storyboard(dist2)
+            sb1 = XamlReader.load(_MOVE_STORYBOARD_XAML.format(dist1)).as_(Storyboard)
+            sb2 = XamlReader.load(_MOVE_STORYBOARD_XAML.format(dist2)).as_(Storyboard)
             sb1.add_completed(
                 lambda s, e: (
                     setattr(current_tf, "y", 0),
@@ -512,16 +758,13 @@ class WidgetsPage:
     def _show_rename_widget_dialog(self, widget_name):
         """Show dialog to rename a widget."""
         try:
-            # Validation pattern: only letters, numbers, underscore, hyphen
-            valid_pattern = re.compile(r"^[a-zA-Z0-9_-]+$")
-
             dialog_template = load_xaml("dialogs/RenameWidgetDialog.xaml")
             dialog_xaml = dialog_template.format(
-                title=UIFactory.escape_xml(t("widgets_rename_title")),
-                primary=UIFactory.escape_xml(t("common_ok")),
-                close=UIFactory.escape_xml(t("common_cancel")),
+                title=_escaped_t("widgets_rename_title"),
+                primary=_escaped_t("common_ok"),
+                close=_escaped_t("common_cancel"),
                 name=UIFactory.escape_xml(widget_name),
-                placeholder=UIFactory.escape_xml(t("widgets_rename_placeholder")),
+                placeholder=_escaped_t("widgets_rename_placeholder"),
             )
 
             dialog = self._app.create_dialog(dialog_xaml)
@@ -537,7 +780,7 @@ class WidgetsPage:
                     error_text.visibility = 0  # Visible
                     dialog.is_primary_button_enabled = False
                     return False
-                if not valid_pattern.match(new_name):
+                if not _VALID_NAME_RE.match(new_name):
                     error_text.text = t("widgets_rename_invalid")
                     error_text.visibility = 0  # Visible
                     dialog.is_primary_button_enabled = False
@@ -559,7 +802,7 @@ class WidgetsPage:
             def on_dialog_closed(sender, args):
                 if args.result == ContentDialogButton.PRIMARY:
                     new_name = name_input.text.strip()
-                    if new_name and new_name != widget_name and valid_pattern.match(new_name):
+                    if new_name and new_name != widget_name and _VALID_NAME_RE.match(new_name):
                         if self._config_manager.rename_widget(widget_name, new_name):
                             self._app.mark_unsaved()
                             self._load_widgets()
@@ -591,11 +834,8 @@ class WidgetsPage:
 
         # Get doc_link from registry by matching type_path
         widget_type = widget.get("type", "unknown")
-        doc_link = ""
-        for wid, info in self._widget_registry.items():
-            if info.type_path == widget_type:
-                doc_link = getattr(info, "doc_link", "")
-                break
+        info = self._registry_by_type_path.get(widget_type)
+        doc_link = getattr(info, "doc_link", "") if info else ""
 
         self._show_widget_editor_dialog(
             widget_name=widget_name,
@@ -646,19 +886,16 @@ class WidgetsPage:
             except Exception:
                 options_text = str(options)
 
-            # Validation pattern for widget names
-            valid_name_pattern = re.compile(r"^[a-zA-Z0-9_-]+$")
-
             # Load dialog from XAML template
             dialog_template = load_xaml("dialogs/YamlEditorDialog.xaml")
             dialog_xaml = dialog_template.format(
-                title=UIFactory.escape_xml(t("widgets_add_dialog_title") if is_new else t("widgets_edit")),
-                save=UIFactory.escape_xml(t("common_add") if is_new else t("common_save")),
-                cancel=UIFactory.escape_xml(t("common_cancel")),
-                error_title=UIFactory.escape_xml(t("widgets_yaml_error_title")),
-                name_label=UIFactory.escape_xml(t("widgets_name")),
+                title=_escaped_t("widgets_add_dialog_title" if is_new else "widgets_edit"),
+                save=_escaped_t("common_add" if is_new else "common_save"),
+                cancel=_escaped_t("common_cancel"),
+                error_title=_escaped_t("widgets_yaml_error_title"),
+                name_label=_escaped_t("widgets_name"),
                 name=UIFactory.escape_xml(widget_name),
-                type_label=UIFactory.escape_xml(t("widgets_type") + ":"),
+                type_label=_escaped_t("widgets_type") + ":",
             )
             dialog = self._app.create_dialog(dialog_xaml)
 
@@ -681,7 +918,7 @@ class WidgetsPage:
             if doc_link:
                 docs_link_text = dialog_content.find_name("DocsLinkText").as_(TextBlock)
                 docs_link_text.text = t("widgets_docs_link")
-                docs_link.add_click(lambda s, e, url=doc_link: __import__("webbrowser").open(url))
+                docs_link.add_click(lambda s, e, url=doc_link: webbrowser.open(url))
                 docs_link.visibility = Visibility.VISIBLE
 
             # Name validation state
@@ -695,7 +932,7 @@ class WidgetsPage:
                     name_error.visibility = Visibility.VISIBLE
                     editor_state_name["valid"] = False
                     return False
-                if not valid_name_pattern.match(new_name):
+                if not _VALID_NAME_RE.match(new_name):
                     name_error.text = t("widgets_rename_invalid")
                     name_error.visibility = Visibility.VISIBLE
                     editor_state_name["valid"] = False
@@ -733,26 +970,39 @@ class WidgetsPage:
                 monaco_theme = editor_theme
 
             # Store editor state
-            editor_state = {"content": options_text, "editor_ready": False, "loader_start_time": None}
-
-            def init_editor_content():
-                """Initialize editor with content after Monaco is ready."""
-                try:
-                    start_time = editor_state.get("loader_start_time") or time.time()
-                    elapsed = time.time() - start_time
-                    init_options = {
-                        "theme": monaco_theme,
-                        "language": "yaml",
-                        "fontFamily": editor_font,
-                        "fontSize": editor_font_size,
-                        "content": options_text,
-                        "focus": True,
-                        "elapsedMs": int(elapsed * 1000),
-                        "minTotalMs": 1000,
-                    }
-                    webview.execute_script_async(f"initEditor({json.dumps(init_options)})")
-                except Exception as e:
-                    error(f"WebView script error: {e}")
+            editor_state = {
+                "content": options_text,
+                "editor_ready": False,
+                "loader_start_time": None,
+                "parsed": None,  # (content, parsed, err) from the last save attempt
+                "dirty": False,  # Set once the editor content changes
+            }
+
+            def build_init_options():
+                """Editor init options, with the loader time elapsed so far."""
+                now = time.monotonic_ns()
+                start_time = editor_state.get("loader_start_time") or now
+                init_options = {
+                    "theme": monaco_theme,
+                    "language": "yaml",
+                    "fontFamily": editor_font,
+                    "fontSize": editor_font_size,
+                    "content": options_text,
+                    "focus": True,
+                    "elapsedMs": (now - start_time) // 1_000_000,
+                    "minTotalMs": 1000,
+                    "contentOnDemand": True,
+                }
+                return init_options
+
+            def build_init_script():
+                """Script that hands the init options to the editor page before it loads."""
+                return f"window.__initOptions = {json.dumps(build_init_options())};"
+
+            def post_to_editor(action, **payload):
+                """Send a command to the editor page; a web message is never evaluated as script."""
+                payload["action"] = action
+                webview.core_webview2.post_web_message_as_json(json.dumps(payload))
 
             def show_editor():
                 """Show the editor and hide the loading overlay."""
@@ -764,12 +1014,14 @@ class WidgetsPage:
                 try:
                     msg = json.loads(args.web_message_as_json)
                     if msg.get("type") == "ready":
-                        editor_state["editor_ready"] = True
-                        init_editor_content()
+                        # The init script was not injected, so the page asks for its options
+                        post_to_editor("init", **build_init_options())
                     elif msg.get("type") == "initialized":
+                        editor_state["editor_ready"] = True
                         show_editor()
                     elif msg.get("type") == "contentChanged":
                         editor_state["content"] = msg.get("content", editor_state["content"])
+                        editor_state["dirty"] = True
                     elif msg.get("type") == "format":
                         content = msg.get("content", "")
                         formatted, err = format_yaml(content)
@@ -778,13 +1030,15 @@ class WidgetsPage:
                             error_infobar.is_open = True
                         else:
                             error_infobar.is_open = False
-                            webview.execute_script_async(f"setFormattedContent({json.dumps(formatted)})")
+                            post_to_editor("setFormattedContent", content=formatted)
                             editor_state["content"] = formatted
+                            editor_state["dirty"] = True
                     elif msg.get("type") == "fix_indentation":
                         content = msg.get("content", "")
                         fixed, err = fix_yaml_indentation(content, widget_type)
-                        webview.execute_script_async(f"setFormattedContent({json.dumps(fixed)})")
+                        post_to_editor("setFormattedContent", content=fixed)
                         editor_state["content"] = fixed
+                        editor_state["dirty"] = True
                         if err:
                             error_infobar.message = err
                             error_infobar.is_open = True
@@ -794,8 +1048,9 @@ class WidgetsPage:
                         content = msg.get("content", "")
                         fixed, err = fix_yaml_indentation(content, widget_type)
                         if fixed != content:
-                            webview.execute_script_async(f"setFormattedContent({json.dumps(fixed)})")
+                            post_to_editor("setFormattedContent", content=fixed)
                             editor_state["content"] = fixed
+                            editor_state["dirty"] = True
                         if err:
                             error_infobar.message = err
                             error_infobar.is_open = True
@@ -805,25 +1060,22 @@ class WidgetsPage:
                     error(f"Web message error: {e}")
 
             webview.add_web_message_received(on_web_message)
-            webview.add_navigation_completed(lambda s, a: None)
 
             self._app._loading = False
 
             def on_dialog_opened(sender, args):
                 """Called when dialog is opened - initialize WebView2 properly."""
-                editor_state["loader_start_time"] = time.time()
-                env_op = CoreWebView2Environment.create_with_options_async("", WEBVIEW_CACHE_DIR, None)
+                editor_state["loader_start_time"] = time.monotonic_ns()
 
-                def on_env_created(op: IAsyncOperation, status: AsyncStatus):
-                    if status == AsyncStatus.ERROR:
-                        error(f"WebView2 environment creation failed: {WinError(op.error_code.value)}")
+                def on_env_created(env, env_error):
+                    if env_error is not None:
+                        error(f"WebView2 environment creation failed: {env_error}")
                         self._show_webview2_missing_dialog()
                         dialog.hide()
                         return
-                    if status != AsyncStatus.COMPLETED:
+                    if env is None:
                         return
 
-                    env = op.get_results()
                     ensure_op = webview.ensure_core_webview2_with_environment_async(env)
 
                     def on_ensure_complete(ensure_op_inner: IAsyncAction, ensure_status: AsyncStatus):
@@ -840,38 +1092,81 @@ class WidgetsPage:
                         ]
                         monaco_context_menu(webview, self._create_icon, t, yaml_extra_items)
 
-                        html_uri = get_code_editor_html_uri()
-                        webview.source = Uri(html_uri)
+                        def on_script_added(script_op, script_status):
+                            if script_status == AsyncStatus.ERROR:
+                                error(f"WebView script error: {WinError(script_op.error_code.value)}")
+                            html_uri = get_code_editor_html_uri()
+                            webview.source = Uri(html_uri)
+
+                        webview.core_webview2.add_script_to_execute_on_document_created_async(
+                            build_init_script()
+                        ).completed = on_script_added
 
                     ensure_op.completed = on_ensure_complete
 
-                env_op.completed = on_env_created
+                get_webview_environment(on_env_created)
 
             def on_dialog_closing(sender, args):
                 """Handle dialog closing - validate and save."""
                 if args.result != ContentDialogButton.PRIMARY:
                     return
+                # Saving an untouched existing widget has nothing to write or reload
+                if not is_new and not editor_state["dirty"] and name_input.text.strip() == widget_name:
+                    return
+                if not validate_name():
+                    args.cancel = True
+                    name_input.focus(FocusState.PROGRAMMATIC)
+                    return
+                if not editor_state["dirty"]:
+                    save_editor_content(args)
+                    return
 
-                try:
-                    if not validate_name():
-                        args.cancel = True
-                        name_input.focus(FocusState.PROGRAMMATIC)
+                # Edited text is only read from the page here, instead of being streamed on every change
+                deferral = args.get_deferral()
+                dispatcher = webview.dispatcher_queue
+
+                def on_content(op: IAsyncOperation, status: AsyncStatus):
+                    def finish():
+                        try:
+                            if status == AsyncStatus.COMPLETED:
+                                value = json.loads(op.get_results() or "null")
+                                if isinstance(value, str):
+                                    editor_state["content"] = value
+                                save_editor_content(args)
+                            else:
+                                error(f"Reading editor content failed: {status}")
+                                args.cancel = True
+                        finally:
+                            deferral.complete()
+
+                    if dispatcher and dispatcher.try_enqueue(finish):
                         return
+                    finish()
 
+                webview.execute_script_async("window.editor ? editor.getValue() : null").completed = on_content
+
+            def save_editor_content(args):
+                """Validate the editor content and apply it to the config."""
+                try:
                     content = editor_state["content"]
-                    webview.execute_script_async("clearError()")
+                    post_to_editor("clearError")
                     new_name = name_input.text.strip()
 
-                    # Parse and validate YAML
-                    parsed, err = parse_yaml(content)
+                    # Parse and validate YAML (unchanged text reuses the previous attempt's result)
+                    cached = editor_state["parsed"]
+                    if cached and cached[0] == content:
+                        _, parsed, err = cached
+                    else:
+                        parsed, err = parse_yaml(content)
+                        editor_state["parsed"] = (content, parsed, err)
                     if err:
                         args.cancel = True
                         error_infobar.message = err
                         error_infobar.is_open = True
-                        match = re.match(r"Line (\d+), Column (\d+):", err)
+                        match = _ERR_LOC_RE.match(err)
                         if match:
                             line, col = int(match.group(1)), int(match.group(2))
-                            webview.execute_script_async(f"showError({line}, {col}, {json.dumps(err)})")
+                            post_to_editor("showError", line=line, column=col, message=err)
                         return
 
                     # Extract options (validate type if present)
@@ -910,6 +1205,8 @@ class WidgetsPage:
                         # Expand the section where widget was added
                         if position in self._section_expanders:
                             self._section_expanders[position].is_expanded = True
+
+                        rows_synced = self._append_widget_row(new_name, position)
                     else:
                         # Update existing widget
                         widget = self._config_manager.get_widget(widget_name)
@@ -917,13 +1214,16 @@ class WidgetsPage:
                             widget["options"] = new_options
                             self._app.mark_unsaved()
 
-                        # Handle rename
+                        # Handle rename; an options-only edit changes nothing a row displays
+                        rows_synced = True
                         if new_name != widget_name:
                             if self._config_manager.rename_widget(widget_name, new_name):
                                 self._app.mark_unsaved()
+                                rows_synced = self._update_widget_row(widget_name, new_name)
 
                     error_infobar.is_open = False
-                    self._load_widgets()
+                    if not rows_synced:
+                        self._load_widgets()
 
                 except Exception as e:
                     error(f"Save error: {e}")
@@ -956,7 +1256,9 @@ class WidgetsPage:
         return formatted if not err else text
 
     def _setup_widget_data(self):
-        """Setup widget data for add dialog."""
+        """Setup widget data for add dialog (built once per registry)."""
+        if self._add_widget_data:
+            return
         try:
             all_widgets = []
             for widget_id, info in self._widget_registry.items():
@@ -969,9 +1271,11 @@ class WidgetsPage:
                         "type_path": info.type_path,
                         "defaults": getattr(info, "defaults", {}),
                         "doc_link": getattr(info, "doc_link", ""),
+                        # Lowercased once so filtering is a single substring check per widget
+                        "_search": f"{info.name}\0{info.category}\0{info.description}".lower(),
                     }
                 )
-            all_widgets.sort(key=lambda x: (x["category"], x["name"]))
+            all_widgets.sort(key=itemgetter("category", "name"))
             self._add_widget_data = {"all_widgets": all_widgets}
         except Exception as e:
             error(f"Setup widget data error: {e}", exc_info=True)
@@ -984,10 +1288,10 @@ class WidgetsPage:
 
             dialog_template = load_xaml("dialogs/AddWidgetDialog.xaml")
             dialog_xaml = dialog_template.format(
-                title=UIFactory.escape_xml(t("widgets_add_dialog_title")),
-                close=UIFactory.escape_xml(t("common_cancel")),
-                position_label=UIFactory.escape_xml(t("widgets_position")),
-                search_placeholder=UIFactory.escape_xml(t("widgets_search")),
+                title=_escaped_t("widgets_add_dialog_title"),
+                close=_escaped_t("common_cancel"),
+                position_label=_escaped_t("widgets_position"),
+                search_placeholder=_escaped_t("widgets_search"),
             )
             dialog = self._app.create_dialog(dialog_xaml)
 
@@ -1005,56 +1309,72 @@ class WidgetsPage:
             pos_to_index = {"left": 0, "center": 1, "right": 2}
             position_combo.selected_index = pos_to_index.get(position, 0)
 
-            def populate_widgets(filter_text=""):
-                widgets_list.children.clear()
-                filter_lower = filter_text.lower().strip()
-                current_category = None
-
-                for widget in all_widgets:
-                    if filter_lower:
-                        if (
-                            filter_lower not in widget["name"].lower()
-                            and filter_lower not in widget["category"].lower()
-                            and filter_lower not in widget["description"].lower()
-                        ):
-                            continue
-
-                    if widget["category"] != current_category:
-                        current_category = widget["category"]
-                        header = self._ui.create_text_block(current_category, "BodyStrongTextBlockStyle")
-                        widgets_list.children.append(header)
-
-                    btn = Button()
-                    btn.horizontal_alignment = 3  # Stretch
-                    btn.horizontal_content_alignment = 3  # Stretch
-                    btn.padding = Thickness(12, 8, 12, 8)
-
-                    content_stack = self._ui.create_stack_panel(spacing=0)
-                    content_stack.horizontal_alignment = 3  # Stretch
-                    name_tb = self._ui.create_text_block(widget["name"], style=None, margin="0")
-                    try:
-                        name_tb.font_weight = "SemiBold"
-                    except Exception:
-                        pass
-
-                    desc_tb = self._ui.create_text_block(widget["description"][:60], style=None, margin="0")
-                    desc_tb.font_size = 11
-                    desc_tb.opacity = 0.7
-                    desc_tb.text_wrapping = 1  # Wrap
-
-                    content_stack.children.append(name_tb)
-                    content_stack.children.append(desc_tb)
-                    btn.content = content_stack
-
-                    def on_widget_click(s, e, w=widget):
-                        dialog.hide()
-                        self._add_widget_to_bar(w, position_combo.selected_index)
+            # Rows are built once per dialog; searching only toggles their visibility
+            groups = []  # (category header, [(widget, button), ...]) in list order
+            rows_panel = []
+            current_category = None
+            for widget in all_widgets:
+                if widget["category"] != current_category:
+                    current_category = widget["category"]
+                    header = self._ui.create_text_block(current_category, "BodyStrongTextBlockStyle")
+                    rows_panel.append(header)
+                    groups.append((header, []))
+
+                btn = Button()
+                btn.horizontal_alignment = 3  # Stretch
+                btn.horizontal_content_alignment = 3  # Stretch
+                btn.padding = Thickness(12, 8, 12, 8)
+
+                content_stack = self._ui.create_stack_panel(spacing=0)
+                content_stack.horizontal_alignment = 3  # Stretch
+                name_tb = self._ui.create_text_block(widget["name"], style=None, margin="0")
+                try:
+                    name_tb.font_weight = "SemiBold"
+                except Exception:
+                    pass
+
+                desc_tb = self._ui.create_text_block(widget["description"][:60], style=None, margin="0")
+                desc_tb.font_size = 11
+                desc_tb.opacity = 0.7
+                desc_tb.text_wrapping = 1  # Wrap
 
-                    btn.add_click(on_widget_click)
-                    widgets_list.children.append(btn)
+                content_stack.children.append(name_tb)
+                content_stack.children.append(desc_tb)
+                btn.content = content_stack
 
-            populate_widgets()
-            search_box.add_text_changed(lambda s, e: populate_widgets(search_box.text))
+                def on_widget_click(s, e, w=widget):
+                    dialog.hide()
+                    self._add_widget_to_bar(w, position_combo.selected_index)
+
+                btn.add_click(on_widget_click)
+                rows_panel.append(btn)
+                groups[-1][1].append((widget, btn))
+            widgets_list.children.extend(rows_panel)
+
+            def filter_widgets(filter_text=""):
+                filter_lower = filter_text.lower().strip()
+                for header, items in groups:
+                    any_visible = False
+                    for widget, btn in items:
+                        visible = not filter_lower or filter_lower in widget["_search"]
+                        btn.visibility = Visibility.VISIBLE if visible else Visibility.COLLAPSED
+                        any_visible = any_visible or visible
+                    header.visibility = Visibility.VISIBLE if any_visible else Visibility.COLLAPSED
+
+            # Coalesce fast typing into a single filter pass
+            search_timer = DispatcherTimer()
+            search_timer.interval = timedelta(milliseconds=120)
+
+            def on_search_tick(s, e):
+                search_timer.stop()
+                filter_widgets(search_box.text)
+
+            def on_search_changed(s, e):
+                search_timer.stop()
+                search_timer.start()
+
+            search_timer.add_tick(on_search_tick)
+            search_box.add_text_changed(on_search_changed)
             dialog.show_async()
 
         except Exception as e:
@@ -1062,8 +1382,7 @@ class WidgetsPage:
 
     def _add_widget_to_bar(self, widget_info, position_idx):
         """Add a widget to the selected bar - opens editor first, only saves on confirm."""
-        positions = ["left", "center", "right"]
-        position = positions[position_idx] if position_idx < len(positions) else "left"
+        position = _POSITIONS[position_idx] if position_idx < len(_POSITIONS) else "left"
 
         self._show_new_widget_dialog(widget_info, position)
 
@@ -1072,11 +1391,11 @@ class WidgetsPage:
         try:
             dialog_template = load_xaml("dialogs/WebView2MissingDialog.xaml")
             dialog_xaml = dialog_template.format(
-                title=UIFactory.escape_xml(t("webview2_missing_title")),
-                message=UIFactory.escape_xml(t("webview2_missing_message")),
-                hint=UIFactory.escape_xml(t("webview2_missing_hint")),
-                download=UIFactory.escape_xml(t("webview2_download")),
-                close=UIFactory.escape_xml(t("webview2_close")),
+                title=_escaped_t("webview2_missing_title"),
+                message=_escaped_t("webview2_missing_message"),
+                hint=_escaped_t("webview2_missing_hint"),
+                download=_escaped_t("webview2_download"),
+                close=_escaped_t("webview2_close"),
             )
             dialog = self._app.create_dialog(dialog_xaml)
 
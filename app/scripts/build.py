@@ -9,8 +9,6 @@ import platform
 import sys
 from pathlib import Path
 
-from cx_Freeze import Executable, setup
-
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parents[1]
 APP_DIR = PROJECT_ROOT / "app"
@@ -20,8 +18,6 @@ DIST_DIR = PROJECT_ROOT / "dist"
 # Ensure the app package is importable regardless of current working directory.
 sys.path.insert(0, str(APP_DIR))
 
-from core.constants import APP_VERSION  # noqa: E402
-
 
 def detect_architecture():
     """Detect the system architecture for build purposes."""
@@ -35,11 +31,19 @@ def detect_architecture():
     return None
 
 
+# Resolved once at import; the build host does not change during a run
+ARCH = detect_architecture()
+
+
 def main():
-    arch_info = detect_architecture()
+    arch_info = ARCH
     if not arch_info:
         raise RuntimeError("Unsupported or undetected architecture. Cannot build.")
 
+    # Imported here so loading this module stays cheap; cx_Freeze is only needed to build
+    from core.constants import APP_VERSION
+    from cx_Freeze import Executable, setup
+
     # Avoid reading project-root metadata (pyproject.toml) by building from the script directory.
     os.chdir(SCRIPT_DIR)
 
@@ -5,10 +5,14 @@ MSIX packager for YASB GUI.
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent.resolve()
@@ -16,45 +20,103 @@ APP_DIR = SCRIPT_DIR.parent
 PROJECT_ROOT = APP_DIR.parent
 ASSETS_DIR = PROJECT_ROOT / "assets"
 
-# Add app directory to path for imports
+# Add app directory to path for imports (app code is only imported by the build functions)
 sys.path.insert(0, str(APP_DIR))
-from core.constants import APP_ID, APP_VERSION
 
+# Minimal manifest - use base names without qualifiers so PRI can resolve variants
+_MANIFEST_TPL = Template(r"""<?xml version="1.0" encoding="utf-8"?>
+<Package xmlns="http://schemas.microsoft.com/appx/manifest/foundation/windows10"
+         xmlns:uap="http://schemas.microsoft.com/appx/manifest/uap/windows10"
+         xmlns:rescap="http://schemas.microsoft.com/appx/manifest/foundation/windows10/restrictedcapabilities"
+         IgnorableNamespaces="uap rescap">
+  <Identity Name="${identity_name}" Publisher="${publisher}" Version="${version}" ProcessorArchitecture="${manifest_arch}" />
+  <Properties>
+    <DisplayName>${display_name}</DisplayName>
+    <PublisherDisplayName>${publisher_display_name}</PublisherDisplayName>
+    <Logo>assets\StoreLogo.png</Logo>
+  </Properties>
+  <Dependencies>
+    <TargetDeviceFamily Name="Windows.Desktop" MinVersion="10.0.17763.0" MaxVersionTested="10.0.22621.0" />
+    <PackageDependency Name="Microsoft.WindowsAppRuntime.1.7" MinVersion="7000.498.2246.0" Publisher="CN=Microsoft Corporation, O=Microsoft Corporation, L=Redmond, S=Washington, C=US" />
+  </Dependencies>
+  <Resources>
+    <Resource Language="en-us" />
+  </Resources>
+  <Capabilities>
+    <rescap:Capability Name="runFullTrust" />
+    <rescap:Capability Name="unvirtualizedResources" />
+  </Capabilities>
+  <Applications>
+    <Application Id="App" Executable="${executable}" EntryPoint="Windows.FullTrustApplication">
+      <uap:VisualElements DisplayName="${display_name}"
+                          Description="${description}"
+                          BackgroundColor="transparent"
+                          Square150x150Logo="assets\Square150x150Logo.png"
+                          Square44x44Logo="assets\Square44x44Logo.png">
+        <uap:DefaultTile Wide310x150Logo="assets\Wide310x150Logo.png"
+                         Square71x71Logo="assets\Square71x71Logo.png"
+                         Square310x310Logo="assets\Square310x310Logo.png">
+          <uap:ShowNameOnTiles>
+            <uap:ShowOn Tile="square150x150Logo"/>
+            <uap:ShowOn Tile="wide310x150Logo"/>
+            <uap:ShowOn Tile="square310x310Logo"/>
+          </uap:ShowNameOnTiles>
+        </uap:DefaultTile>
+        <uap:SplashScreen Image="assets\SplashScreen.png"/>
+      </uap:VisualElements>
+    </Application>
+  </Applications>
+</Package>
+""")
 
-def find_makeappx() -> str | None:
-    """Find makeappx.exe in Windows SDK."""
+
+@lru_cache(maxsize=None)
+def _find_sdk_tools() -> tuple[str | None, str | None]:
+    """Find (makeappx.exe, makepri.exe) in the newest Windows SDK with one scan of the kits tree."""
     kits_root = Path(r"C:\Program Files (x86)\Windows Kits\10\bin")
     if not kits_root.exists():
-        return None
+        return None, None
 
-    candidates = []
-    for version_dir in kits_root.glob("*"):
-        if not version_dir.is_dir():
-            continue
-        for arch in ("x64", "arm64"):
-            candidate = version_dir / arch / "makeappx.exe"
-            if candidate.exists():
-                candidates.append(candidate)
+    candidates = {"makeappx.exe": [], "makepri.exe": []}
+    with os.scandir(kits_root) as entries:
+        for version_dir in entries:
+            if not version_dir.is_dir():
+                continue
+            for arch in ("x64", "arm64"):
+                for tool, found in candidates.items():
+                    candidate = Path(version_dir.path) / arch / tool
+                    if candidate.exists():
+                        found.append(candidate)
 
-    return str(sorted(candidates)[-1]) if candidates else None
+    makeappx, makepri = (str(max(found)) if found else None for found in candidates.values())
+    return makeappx, makepri
+
+
+def find_makeappx() -> str | None:
+    """Find makeappx.exe in Windows SDK."""
+    return _find_sdk_tools()[0]
 
 
 def find_makepri() -> str | None:
     """Find makepri.exe in Windows SDK."""
-    kits_root = Path(r"C:\Program Files (x86)\Windows Kits\10\bin")
-    if not kits_root.exists():
-        return None
+    return _find_sdk_tools()[1]
 
-    candidates = []
-    for version_dir in kits_root.glob("*"):
-        if not version_dir.is_dir():
-            continue
-        for arch in ("x64", "arm64"):
-            candidate = version_dir / arch / "makepri.exe"
-            if candidate.exists():
-                candidates.append(candidate)
 
-    return str(sorted(candidates)[-1]) if candidates else None
+def _clone_tree(src: Path, dst: Path) -> None:
+    """Hardlink every file of src into dst, copying where linking fails (e.g. across volumes).
+
+    The layout is only read by makepri/makeappx, so sharing file data with dist is safe.
+    """
+    for root, _dirs, files in os.walk(src):
+        target_dir = dst / Path(root).relative_to(src)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            source = os.path.join(root, name)
+            target = target_dir / name
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
 
 
 def build_msix(
@@ -69,6 +131,8 @@ def build_msix(
     arch: str,
 ) -> Path:
     """Build MSIX package from dist directory."""
+    from core.constants import APP_VERSION
+
     if not dist_dir.exists():
         raise FileNotFoundError(f"dist directory not found: {dist_dir}")
 
@@ -81,20 +145,27 @@ def build_msix(
         shutil.rmtree(layout_dir)
     layout_dir.mkdir(parents=True, exist_ok=True)
 
+    # The PRI config only needs its output path, so generate it while the layout is being copied
+    makepri = find_makepri()
+    priconfig = layout_dir / "priconfig.xml"
+    createconfig = None
+    if makepri:
+        createconfig = subprocess.Popen([makepri, "createconfig", "/cf", str(priconfig), "/dq", "en-US", "/o"])
+
     # Copy dist contents
-    shutil.copytree(dist_dir, layout_dir, dirs_exist_ok=True)
+    _clone_tree(dist_dir, layout_dir)
 
     # Copy MSIX assets (icon.png, StoreLogo.png, and unplated variants for taskbar)
     assets_out = layout_dir / "assets"
     assets_out.mkdir(parents=True, exist_ok=True)
-    for asset in ASSETS_DIR.glob("*.png"):
-        shutil.copy2(asset, assets_out / asset.name)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        # list() re-raises any copy error
+        list(pool.map(lambda asset: shutil.copy2(asset, assets_out / asset.name), ASSETS_DIR.glob("*.png")))
 
     # Generate resources.pri from layout directory (indexes unplated assets with correct paths)
-    makepri = find_makepri()
-    if makepri:
-        priconfig = layout_dir / "priconfig.xml"
-        subprocess.run([makepri, "createconfig", "/cf", str(priconfig), "/dq", "en-US", "/o"], check=True)
+    if createconfig:
+        if createconfig.wait() != 0:
+            raise subprocess.CalledProcessError(createconfig.returncode, createconfig.args)
         subprocess.run(
             [
                 makepri,
@@ -119,52 +190,17 @@ def build_msix(
         parts.append("0")
     version = ".".join(parts[:4])
 
-    # Write minimal manifest - use base names without qualifiers so PRI can resolve variants
-    manifest = f'''<?xml version="1.0" encoding="utf-8"?>
-<Package xmlns="http://schemas.microsoft.com/appx/manifest/foundation/windows10"
-         xmlns:uap="http://schemas.microsoft.com/appx/manifest/uap/windows10"
-         xmlns:rescap="http://schemas.microsoft.com/appx/manifest/foundation/windows10/restrictedcapabilities"
-         IgnorableNamespaces="uap rescap">
-  <Identity Name="{identity_name}" Publisher="{publisher}" Version="{version}" ProcessorArchitecture="{manifest_arch}" />
-  <Properties>
-    <DisplayName>{display_name}</DisplayName>
-    <PublisherDisplayName>{publisher_display_name}</PublisherDisplayName>
-    <Logo>assets\\StoreLogo.png</Logo>
-  </Properties>
-  <Dependencies>
-    <TargetDeviceFamily Name="Windows.Desktop" MinVersion="10.0.17763.0" MaxVersionTested="10.0.22621.0" />
-    <PackageDependency Name="Microsoft.WindowsAppRuntime.1.7" MinVersion="7000.498.2246.0" Publisher="CN=Microsoft Corporation, O=Microsoft Corporation, L=Redmond, S=Washington, C=US" />
-  </Dependencies>
-  <Resources>
-    <Resource Language="en-us" />
-  </Resources>
-  <Capabilities>
-    <rescap:Capability Name="runFullTrust" />
-    <rescap:Capability Name="unvirtualizedResources" />
-  </Capabilities>
-  <Applications>
-    <Application Id="App" Executable="{executable}" EntryPoint="Windows.FullTrustApplication">
-      <uap:VisualElements DisplayName="{display_name}"
-                          Description="{description}"
-                          BackgroundColor="transparent"
-                          Square150x150Logo="assets\\Square150x150Logo.png"
-                          Square44x44Logo="assets\\Square44x44Logo.png">
-        <uap:DefaultTile Wide310x150Logo="assets\\Wide310x150Logo.png"
-                         Square71x71Logo="assets\\Square71x71Logo.png"
-                         Square310x310Logo="assets\\Square310x310Logo.png">
-          <uap:ShowNameOnTiles>
-            <uap:ShowOn Tile="square150x150Logo"/>
-            <uap:ShowOn Tile="wide310x150Logo"/>
-            <uap:ShowOn Tile="square310x310Logo"/>
-          </uap:ShowNameOnTiles>
-        </uap:DefaultTile>
-        <uap:SplashScreen Image="assets\\SplashScreen.png"/>
-      </uap:VisualElements>
-    </Application>
-  </Applications>
-</Package>
-'''
-    (layout_dir / "AppxManifest.xml").write_text(manifest, encoding="utf-8")
+    manifest = _MANIFEST_TPL.substitute(
+        identity_name=identity_name,
+        publisher=publisher,
+        version=version,
+        manifest_arch=manifest_arch,
+        display_name=display_name,
+        publisher_display_name=publisher_display_name,
+        executable=executable,
+        description=description,
+    )
+    (layout_dir / "AppxManifest.xml").write_bytes(manifest.encode("utf-8"))
 
     # Create MSIX
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -181,6 +217,8 @@ def build_msix(
 
 def build_msixbundle(msix_files: list[Path], output_dir: Path) -> Path:
     """Build MSIX bundle from multiple MSIX packages."""
+    from core.constants import APP_ID, APP_VERSION
+
     makeappx = find_makeappx()
     if not makeappx:
         raise RuntimeError("makeappx.exe not found. Install Windows SDK.")
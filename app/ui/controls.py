@@ -4,9 +4,13 @@ UI control factory for YASB GUI.
 Creates WinUI 3 controls with consistent styling.
 """
 
+from functools import lru_cache
+
 from core.preferences import get_preferences
 from ui.loader import load_xaml
-from winui3.microsoft.ui.xaml import Application
+from winrt.windows.foundation import PropertyValue
+from winrt.windows.ui import Color
+from winui3.microsoft.ui.xaml import Application, TextWrapping, Thickness
 from winui3.microsoft.ui.xaml.controls import (
     Button,
     ComboBox,
@@ -15,6 +19,7 @@ from winui3.microsoft.ui.xaml.controls import (
     FontIcon,
     HyperlinkButton,
     InfoBar,
+    Orientation,
     Slider,
     StackPanel,
     TextBlock,
@@ -22,7 +27,132 @@ from winui3.microsoft.ui.xaml.controls import (
     ToggleSwitch,
 )
 from winui3.microsoft.ui.xaml.markup import XamlReader
-from winui3.microsoft.ui.xaml.media import FontFamily
+from winui3.microsoft.ui.xaml.media import FontFamily, SolidColorBrush
+
+
+@lru_cache(maxsize=None)
+def _thickness(value):
+    """Thickness from a XAML-style "uniform", "horizontal,vertical" or "left,top,right,bottom" string."""
+    parts = [float(p) for p in str(value).split(",")]
+    if len(parts) == 1:
+        return Thickness(parts[0], parts[0], parts[0], parts[0])
+    if len(parts) == 2:
+        return Thickness(parts[0], parts[1], parts[0], parts[1])
+    return Thickness(*parts[:4])
+
+
+@lru_cache(maxsize=None)
+def _font_family(name):
+    """Shared FontFamily per font name (keyed by name, so a preference change needs no invalidation)."""
+    return FontFamily(name)
+
+
+# Danger button colors; the resource keys override the pointer-over/pressed visual states
+_DANGER = (0xC4, 0x2B, 0x1C)
+_DANGER_HOVER = (0xA1, 0x24, 0x16)
+_DANGER_PRESSED = (0x8A, 0x1F, 0x12)
+_WHITE = (0xFF, 0xFF, 0xFF)
+_DANGER_RESOURCES = (
+    ("ButtonBackgroundPointerOver", _DANGER_HOVER),
+    ("ButtonBackgroundPressed", _DANGER_PRESSED),
+    ("ButtonBorderBrushPointerOver", _DANGER_HOVER),
+    ("ButtonBorderBrushPressed", _DANGER_PRESSED),
+    ("ButtonForegroundPointerOver", _WHITE),
+    ("ButtonForegroundPressed", _WHITE),
+)
+
+
+@lru_cache(maxsize=None)
+def _solid_brush(rgb):
+    """Shared opaque brush per (r, g, b), created on first use (brushes need the XAML runtime running)."""
+    r, g, b = rgb
+    return SolidColorBrush(Color(a=255, r=r, g=g, b=b))
+
+
+# One translate pass beats both a chain of str.replace calls (a pass per character)
+# and a regex sub with a callback for the short labels escaped here
+_XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+@lru_cache(maxsize=1024)
+def _escape_cached(text):
+    """Escaped form of a label that needs escaping; labels repeat across pages."""
+    return text.translate(_XML_ESCAPE_TABLE)
+
+
+def escape_xml(text):
+    """Escape special XML characters."""
+    # Most labels have nothing to escape; return them without building a new string
+    if "&" not in text and "<" not in text and ">" not in text and '"' not in text:
+        return text
+    return _escape_cached(text)
+
+
+# XAML templates filled with str.format; literal braces (markup extensions) are doubled
+_SECONDARY_FOREGROUND = 'Foreground="{ThemeResource TextFillColorSecondaryBrush}"'
+
+_BUTTON_XAML = """<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Content="{text}" HorizontalAlignment="Stretch" Padding="12,8"/>"""
+_TEXT_BLOCK_XAML = """<TextBlock xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Text="{text}" {style} {wrap} {foreground} Margin="{margin}"/>"""
+_PAGE_TITLE_XAML = """<TextBlock xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Text="{text}" Style="{{StaticResource TitleTextBlockStyle}}" Margin="0,0,0,24"/>"""
+_TOGGLE_XAML = """<ToggleSwitch xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Header="{header}" IsOn="{is_on}" OnContent="{on_text}" OffContent="{off_text}"/>"""
+_TEXTBOX_XAML = """<TextBox xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Header="{header}" Text="{text}" Width="400" HorizontalAlignment="Left"/>"""
+_TEXTBOX_MULTILINE_XAML = """<TextBox xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
+    AcceptsReturn="True" TextWrapping="Wrap" MinHeight="450"
+    HorizontalAlignment="Stretch">
+    <TextBox.Resources>
+        <StaticResource x:Key="TextControlBackground" ResourceKey="LayerFillColorDefaultBrush"/>
+        <StaticResource x:Key="TextControlBackgroundPointerOver" ResourceKey="LayerFillColorDefaultBrush"/>
+        <StaticResource x:Key="TextControlBackgroundFocused" ResourceKey="LayerFillColorDefaultBrush"/>
+        <StaticResource x:Key="TextControlBackgroundDisabled" ResourceKey="LayerFillColorDefaultBrush"/>
+    </TextBox.Resources>
+</TextBox>"""
+_SLIDER_XAML = """<Slider xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Header="{header}" Value="{value}" Minimum="{min_val}" Maximum="{max_val}"
+    StepFrequency="{step}" Width="400" HorizontalAlignment="Left"/>"""
+_COMBOBOX_XAML = """<ComboBox xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Header="{header}" Width="200">{items}</ComboBox>"""
+_PATH_TEXT_XAML = """<TextBlock xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Text="{text}" IsTextSelectionEnabled="True"
+    Foreground="{{ThemeResource TextFillColorSecondaryBrush}}"/>"""
+_EXPANDER_XAML = """<Expander xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Header="{header}" Style="{{StaticResource SectionExpanderStyle}}"/>"""
+_EXPANDER_DESC_XAML = """<Expander xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Style="{{StaticResource SectionExpanderStyle}}">
+    <Expander.Header>
+        <StackPanel Spacing="2" Margin="0,16,0,16" HorizontalAlignment="Stretch">
+            <TextBlock Text="{header}" Style="{{StaticResource BodyStrongTextBlockStyle}}"/>
+            <TextBlock Text="{description}" Style="{{StaticResource CaptionTextBlockStyle}}" Foreground="{{ThemeResource TextFillColorSecondaryBrush}}"/>
+        </StackPanel>
+    </Expander.Header>
+</Expander>"""
+_STYLED_BUTTON_XAML = """<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Content="{text}" {style} Padding="{padding}"/>"""
+_ICON_BUTTON_XAML = """<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Padding="{padding}" VerticalAlignment="Center">
+    <FontIcon Glyph="{glyph}" FontSize="{font_size}"/>
+</Button>"""
+_ICON_TEXT_BUTTON_XAML = """<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" Padding="{padding}">
+    <StackPanel Orientation="Horizontal" Spacing="{spacing}">
+        <FontIcon Glyph="{glyph}" FontSize="{font_size}"/>
+        <TextBlock Text="{text}" VerticalAlignment="Center"/>
+    </StackPanel>
+</Button>"""
+_INFO_BAR_XAML = """<InfoBar xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    IsOpen="True" {title} {message} IsClosable="{is_closable}"
+    Severity="{severity}" Margin="{margin}" IsIconVisible="{icon_visible}">
+    {action}
+</InfoBar>"""
+_INFO_BAR_ACTION_XAML = """<InfoBar.ActionButton>
+    <HyperlinkButton Content="{text}" NavigateUri="{uri}"/>
+</InfoBar.ActionButton>"""
+_FONT_ICON_XAML = """<FontIcon xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+    Glyph="{glyph}" FontSize="{font_size}" {foreground}/>"""
 
 
 class UIFactory:
@@ -31,8 +161,8 @@ class UIFactory:
     _common_resources_loaded = False
 
     @staticmethod
-    def _ensure_common_resources():
-        """Load shared XAML resources once."""
+    def initialize():
+        """Load shared XAML resources; called once after the application resources are set up."""
         if UIFactory._common_resources_loaded:
             return
         if not Application.current:
@@ -57,94 +187,79 @@ class UIFactory:
         prefs = get_preferences()
         return prefs.get("editor_font_size", 13) if prefs else 13
 
-    @staticmethod
-    def escape_xml(text):
-        """Escape special XML characters."""
-        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    # Module-level function so the builders below call it without the class lookup
+    escape_xml = staticmethod(escape_xml)
 
     @staticmethod
     def create_button(text):
         """Create styled button."""
-        safe_text = UIFactory.escape_xml(text)
-        xaml = f'''<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Content="{safe_text}" HorizontalAlignment="Stretch" Padding="12,8"/>'''
+        xaml = _BUTTON_XAML.format(text=escape_xml(text))
         return XamlReader.load(xaml).as_(Button)
 
     @staticmethod
     def create_text_block(text, style=None, margin="0,8,0,4", wrap=False, secondary=False):
         """Create styled text block."""
-        safe_text = UIFactory.escape_xml(text)
-        style_attr = f'Style="{{StaticResource {style}}}"' if style else ""
-        wrap_attr = 'TextWrapping="Wrap"' if wrap else ""
-        foreground_attr = 'Foreground="{ThemeResource TextFillColorSecondaryBrush}"' if secondary else ""
-        xaml = f'''<TextBlock xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Text="{safe_text}" {style_attr} {wrap_attr} {foreground_attr} Margin="{margin}"/>'''
+        if not style and not secondary:
+            # Nothing to resolve from resources, so skip the XAML parser
+            tb = TextBlock()
+            tb.text = text
+            if wrap:
+                tb.text_wrapping = TextWrapping.WRAP
+            tb.margin = _thickness(margin)
+            return tb
+        xaml = _TEXT_BLOCK_XAML.format(
+            text=escape_xml(text),
+            style=f'Style="{{StaticResource {style}}}"' if style else "",
+            wrap='TextWrapping="Wrap"' if wrap else "",
+            foreground=_SECONDARY_FOREGROUND if secondary else "",
+            margin=margin,
+        )
         return XamlReader.load(xaml).as_(TextBlock)
 
     @staticmethod
     def create_page_title(text):
         """Create standard page title."""
-        safe_text = UIFactory.escape_xml(text)
-        xaml = f'''<TextBlock xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Text="{safe_text}" Style="{{StaticResource TitleTextBlockStyle}}"
-                    Margin="0,0,0,24"/>'''
+        xaml = _PAGE_TITLE_XAML.format(text=escape_xml(text))
         return XamlReader.load(xaml).as_(TextBlock)
 
     @staticmethod
     def create_toggle(header, is_on, on_text=None, off_text=None):
         """Create toggle switch."""
-        safe_header = UIFactory.escape_xml(header)
-        on_label = UIFactory.escape_xml(on_text) if on_text is not None else "On"
-        off_label = UIFactory.escape_xml(off_text) if off_text is not None else "Off"
-        on_str = "True" if is_on else "False"
-        xaml = f'''<ToggleSwitch xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Header="{safe_header}" IsOn="{on_str}" OnContent="{on_label}" OffContent="{off_label}"/>'''
+        xaml = _TOGGLE_XAML.format(
+            header=escape_xml(header),
+            is_on="True" if is_on else "False",
+            on_text=escape_xml(on_text) if on_text is not None else "On",
+            off_text=escape_xml(off_text) if off_text is not None else "Off",
+        )
         return XamlReader.load(xaml).as_(ToggleSwitch)
 
     @staticmethod
     def create_textbox(header, text):
         """Create text box."""
-        safe_text = UIFactory.escape_xml(text)
-        safe_header = UIFactory.escape_xml(header)
-        xaml = f'''<TextBox xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Header="{safe_header}" Text="{safe_text}" Width="400" HorizontalAlignment="Left"/>'''
+        xaml = _TEXTBOX_XAML.format(header=escape_xml(header), text=escape_xml(text))
         return XamlReader.load(xaml).as_(TextBox)
 
     @staticmethod
     def create_textbox_multiline(header, text):
         """Create multiline text box with dark background."""
-        xaml = """<TextBox xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
-                    AcceptsReturn="True" TextWrapping="Wrap" MinHeight="450"
-                    HorizontalAlignment="Stretch">
-                    <TextBox.Resources>
-                        <StaticResource x:Key="TextControlBackground" ResourceKey="LayerFillColorDefaultBrush"/>
-                        <StaticResource x:Key="TextControlBackgroundPointerOver" ResourceKey="LayerFillColorDefaultBrush"/>
-                        <StaticResource x:Key="TextControlBackgroundFocused" ResourceKey="LayerFillColorDefaultBrush"/>
-                        <StaticResource x:Key="TextControlBackgroundDisabled" ResourceKey="LayerFillColorDefaultBrush"/>
-                    </TextBox.Resources>
-                </TextBox>"""
-        tb = XamlReader.load(xaml).as_(TextBox)
+        tb = XamlReader.load(_TEXTBOX_MULTILINE_XAML).as_(TextBox)
         tb.text = text
-        tb.font_family = FontFamily(UIFactory.get_editor_font())
+        tb.font_family = _font_family(UIFactory.get_editor_font())
         tb.font_size = UIFactory.get_editor_font_size()
         return tb
 
     @staticmethod
     def create_numberbox(header, value, min_val=0, max_val=1000, step=1):
         """Create slider for numeric input."""
-        xaml = f'''<Slider xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Header="{header}" Value="{value}" Minimum="{min_val}" Maximum="{max_val}"
-                    StepFrequency="{step}" Width="400" HorizontalAlignment="Left"/>'''
+        xaml = _SLIDER_XAML.format(header=header, value=value, min_val=min_val, max_val=max_val, step=step)
         return XamlReader.load(xaml).as_(Slider)
 
     @staticmethod
     def create_combobox(header, items, selected):
         """Create combo box with items."""
-        items_xaml = "".join([f'<ComboBoxItem Content="{item}"/>' for item in items])
-        xaml = f'''<ComboBox xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Header="{header}" Width="200">{items_xaml}</ComboBox>'''
-        cb = XamlReader.load(xaml).as_(ComboBox)
+        esc = escape_xml
+        items_xaml = "".join(f'<ComboBoxItem Content="{esc(str(item))}"/>' for item in items)
+        cb = XamlReader.load(_COMBOBOX_XAML.format(header=esc(header), items=items_xaml)).as_(ComboBox)
         try:
             idx = items.index(selected)
             cb.selected_index = idx
@@ -155,105 +270,94 @@ class UIFactory:
     @staticmethod
     def create_combobox_item(content, tag=None):
         """Create combo box item."""
-        safe_content = UIFactory.escape_xml(content)
-        tag_attr = f' Tag="{UIFactory.escape_xml(tag)}"' if tag is not None else ""
-        xaml = f'''<ComboBoxItem xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Content="{safe_content}"{tag_attr}/>'''
-        return XamlReader.load(xaml).as_(ComboBoxItem)
+        item = ComboBoxItem()
+        item.content = PropertyValue.create_string(content)
+        if tag is not None:
+            item.tag = PropertyValue.create_string(tag)
+        return item
 
     @staticmethod
     def create_simple_combobox(min_width=150):
         """Create plain combo box."""
-        xaml = f'''<ComboBox xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    MinWidth="{min_width}"/>'''
-        return XamlReader.load(xaml).as_(ComboBox)
+        cb = ComboBox()
+        cb.min_width = min_width
+        return cb
 
     @staticmethod
     def create_path_text(text):
         """Create selectable path text block."""
-        safe_text = UIFactory.escape_xml(text)
-        xaml = f'''<TextBlock xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Text="{safe_text}" IsTextSelectionEnabled="True" 
-                    Foreground="{{ThemeResource TextFillColorSecondaryBrush}}"/>'''
+        xaml = _PATH_TEXT_XAML.format(text=escape_xml(text))
         return XamlReader.load(xaml).as_(TextBlock)
 
     @staticmethod
     def create_expander(header, description=None):
         """Create expander with header and optional description."""
-        UIFactory._ensure_common_resources()
-        safe_header = UIFactory.escape_xml(header)
-        style_attr = 'Style="{StaticResource SectionExpanderStyle}"'
+        safe_header = escape_xml(header)
         if description:
-            safe_desc = UIFactory.escape_xml(description)
-            xaml = f'''<Expander xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                        {style_attr}>
-                        <Expander.Header>
-                            <StackPanel Spacing="2" Margin="0,16,0,16" HorizontalAlignment="Stretch">
-                                <TextBlock Text="{safe_header}" Style="{{StaticResource BodyStrongTextBlockStyle}}"/>
-                                <TextBlock Text="{safe_desc}" Style="{{StaticResource CaptionTextBlockStyle}}" Foreground="{{ThemeResource TextFillColorSecondaryBrush}}"/>
-                            </StackPanel>
-                        </Expander.Header>
-                    </Expander>'''
+            xaml = _EXPANDER_DESC_XAML.format(header=safe_header, description=escape_xml(description))
         else:
-            xaml = f'''<Expander xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                        Header="{safe_header}" {style_attr}/>'''
+            xaml = _EXPANDER_XAML.format(header=safe_header)
         return XamlReader.load(xaml).as_(Expander)
 
+    @staticmethod
+    def attach_expander_content(expander, build_fn):
+        """Set an expander's content from build_fn the first time it expands."""
+        if expander.is_expanded:
+            expander.content = build_fn()
+            return
+        populated = False
+
+        def on_expanding(sender, args):
+            nonlocal populated
+            if not populated:
+                populated = True
+                expander.content = build_fn()
+
+        expander.add_expanding(on_expanding)
+
     @staticmethod
     def create_stack_panel(spacing=8, orientation="Vertical"):
         """Create stack panel."""
-        xaml = f'''<StackPanel xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" 
-                    Spacing="{spacing}" Orientation="{orientation}"/>'''
-        return XamlReader.load(xaml).as_(StackPanel)
+        panel = StackPanel()
+        panel.spacing = spacing
+        panel.orientation = Orientation.HORIZONTAL if orientation == "Horizontal" else Orientation.VERTICAL
+        return panel
 
     @staticmethod
     def create_styled_button(text, style=None, padding="12,8"):
         """Create button with optional style."""
-        safe_text = UIFactory.escape_xml(text)
-        style_attr = f'Style="{{StaticResource {style}}}"' if style else ""
-        xaml = f'''<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                    Content="{safe_text}" {style_attr} Padding="{padding}"/>'''
+        xaml = _STYLED_BUTTON_XAML.format(
+            text=escape_xml(text),
+            style=f'Style="{{StaticResource {style}}}"' if style else "",
+            padding=padding,
+        )
         return XamlReader.load(xaml).as_(Button)
 
     @staticmethod
     def create_icon_button(glyph, padding="8,6", font_size=12):
         """Create button with icon."""
-        xaml = f'''<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                    Padding="{padding}" VerticalAlignment="Center">
-                    <FontIcon Glyph="{glyph}" FontSize="{font_size}"/>
-                </Button>'''
+        xaml = _ICON_BUTTON_XAML.format(glyph=glyph, padding=padding, font_size=font_size)
         return XamlReader.load(xaml).as_(Button)
 
     @staticmethod
     def create_icon_text_button(glyph, text, spacing=8, padding="8,6", font_size=12):
         """Create button with icon and text."""
-        safe_text = UIFactory.escape_xml(text)
-        xaml = f'''<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation" Padding="{padding}">
-                    <StackPanel Orientation="Horizontal" Spacing="{spacing}">
-                        <FontIcon Glyph="{glyph}" FontSize="{font_size}"/>
-                        <TextBlock Text="{safe_text}" VerticalAlignment="Center"/>
-                    </StackPanel>
-                </Button>'''
+        xaml = _ICON_TEXT_BUTTON_XAML.format(
+            glyph=glyph, text=escape_xml(text), spacing=spacing, padding=padding, font_size=font_size
+        )
         return XamlReader.load(xaml).as_(Button)
 
     @staticmethod
     def create_danger_button(text):
         """Create red danger button."""
-        safe_text = UIFactory.escape_xml(text)
-        xaml = f'''<Button xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
-                    Content="{safe_text}"
-                    Background="#c42b1c" Foreground="White" BorderBrush="#c42b1c">
-                    <Button.Resources>
-                        <SolidColorBrush x:Key="ButtonBackgroundPointerOver" Color="#a12416"/>
-                        <SolidColorBrush x:Key="ButtonBackgroundPressed" Color="#8a1f12"/>
-                        <SolidColorBrush x:Key="ButtonBorderBrushPointerOver" Color="#a12416"/>
-                        <SolidColorBrush x:Key="ButtonBorderBrushPressed" Color="#8a1f12"/>
-                        <SolidColorBrush x:Key="ButtonForegroundPointerOver" Color="White"/>
-                        <SolidColorBrush x:Key="ButtonForegroundPressed" Color="White"/>
-                    </Button.Resources>
-                </Button>'''
-        return XamlReader.load(xaml).as_(Button)
+        btn = Button()
+        btn.content = PropertyValue.create_string(text)
+        btn.background = _solid_brush(_DANGER)
+        btn.foreground = _solid_brush(_WHITE)
+        btn.border_brush = _solid_brush(_DANGER)
+        for key, color in _DANGER_RESOURCES:
+            btn.resources.insert(PropertyValue.create_string(key), _solid_brush(color))
+        return btn
 
     @staticmethod
     def create_info_bar(
@@ -267,39 +371,36 @@ class UIFactory:
         action_text=None,
     ):
         """Create info bar with optional hyperlink action."""
-        safe_title = UIFactory.escape_xml(title) if title else ""
-        safe_message = UIFactory.escape_xml(message) if message else ""
-        icon_visible = "True" if show_icon else "False"
-
-        title_attr = f'Title="{safe_title}"' if title else ""
-        message_attr = f'Message="{safe_message}"' if message else ""
-
-        action_button = ""
+        action = ""
         if action_uri and action_text:
-            safe_action_text = UIFactory.escape_xml(action_text)
-            action_button = f'''<InfoBar.ActionButton>
-                <HyperlinkButton Content="{safe_action_text}" NavigateUri="{action_uri}"/>
-            </InfoBar.ActionButton>'''
-
-        xaml = f'''<InfoBar xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                    IsOpen="True" {title_attr} {message_attr} IsClosable="{str(is_closable)}"
-                    Severity="{severity}" Margin="{margin}" IsIconVisible="{icon_visible}">
-                    {action_button}
-                </InfoBar>'''
+            action = _INFO_BAR_ACTION_XAML.format(text=escape_xml(action_text), uri=action_uri)
+
+        xaml = _INFO_BAR_XAML.format(
+            title=f'Title="{escape_xml(title)}"' if title else "",
+            message=f'Message="{escape_xml(message)}"' if message else "",
+            is_closable=str(is_closable),
+            severity=severity,
+            margin=margin,
+            icon_visible="True" if show_icon else "False",
+            action=action,
+        )
         return XamlReader.load(xaml).as_(InfoBar)
 
     @staticmethod
     def create_hyperlink_button(text, padding="0"):
         """Create hyperlink button."""
-        safe_text = UIFactory.escape_xml(text)
-        xaml = f'''<HyperlinkButton xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                    Content="{safe_text}" Padding="{padding}"/>'''
-        return XamlReader.load(xaml).as_(HyperlinkButton)
+        btn = HyperlinkButton()
+        btn.content = PropertyValue.create_string(text)
+        btn.padding = _thickness(padding)
+        return btn
 
     @staticmethod
     def create_font_icon(glyph, font_size=14, secondary=False):
         """Create font icon."""
-        foreground = 'Foreground="{ThemeResource TextFillColorSecondaryBrush}"' if secondary else ""
-        xaml = f'''<FontIcon xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                    Glyph="{glyph}" FontSize="{font_size}" {foreground}/>'''
+        if not secondary:
+            icon = FontIcon()
+            icon.glyph = glyph
+            icon.font_size = font_size
+            return icon
+        xaml = _FONT_ICON_XAML.format(glyph=glyph, font_size=font_size, foreground=_SECONDARY_FOREGROUND)
         return XamlReader.load(xaml).as_(FontIcon)
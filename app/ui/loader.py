@@ -3,10 +3,16 @@ Loader for XAML files used in the UI.
 Loads XAML from the app/xaml directory.
 """
 
+import os
+from functools import lru_cache
+
 from core.constants import APP_BASE_PATH
 
+_XAML_DIR = os.fspath(APP_BASE_PATH / "app" / "xaml")
+
 
+@lru_cache(maxsize=None)
 def load_xaml(name: str) -> str:
-    xaml_path = APP_BASE_PATH / "app" / "xaml" / name
-    with open(xaml_path, encoding="utf-8") as f:
-        return f.read()
+    """Read a XAML file (cached; the templates never change while the app runs)."""
+    with open(os.path.join(_XAML_DIR, name), "rb") as f:
+        return f.read().decode("utf-8")
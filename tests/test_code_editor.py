@@ -5,10 +5,6 @@ Makes sure the code editor can properly handle YAML configs - catching errors,
 formatting nicely, and converting between YAML and Python dicts.
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
 from core.code_editor import (
     dict_to_yaml,
     extract_widget_options,
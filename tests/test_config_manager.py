@@ -5,14 +5,11 @@ Makes sure we can read/write config files, modify widgets and bars,
 and track changes properly.
 """
 
+import re
 import shutil
-import sys
 from pathlib import Path
 
 import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
-
 from core.config_manager import ConfigManager
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -148,6 +145,27 @@ class TestWidgetOperations:
         bar = manager_with_config.get_bar("primary-bar")
         assert "volume" not in bar["widgets"]["right"]
 
+    def test_delete_widget_removes_repeated_references(self, manager_with_config, temp_config_dir):
+        """A widget listed twice in one position should leave no reference behind, nor drop other comments."""
+        config_path = temp_config_dir / "config.yaml"
+        text = config_path.read_text(encoding="utf-8")
+        text = text.replace(
+            '      - "volume"\n      - "notifications"\n      - "power_menu"\n',
+            '      - "volume"\n      - "notifications"  # bell\n      - "volume"\n      - "power_menu"  # power\n',
+        )
+        config_path.write_text(text, encoding="utf-8")
+
+        manager_with_config.load_config()
+        right = manager_with_config.get_bar("primary-bar")["widgets"]["right"]
+        assert right.count("volume") == 2
+        manager_with_config.delete_widget("volume")
+        manager_with_config.save_config()
+
+        assert "volume" not in right
+        saved = config_path.read_text(encoding="utf-8")
+        assert re.search(r'- "notifications" +# bell', saved)
+        assert re.search(r'- "power_menu" +# power', saved)
+
     def test_delete_nonexistent_widget(self, manager_with_config):
         """Can't delete what doesn't exist."""
         manager_with_config.load_config()
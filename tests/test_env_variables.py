@@ -0,0 +1,127 @@
+"""
+Tests for .env file handling - the Environment Variables page's storage.
+
+Parsing and writing live in core.env_file and are tested directly. The page
+itself imports WinUI, so its test only runs where the Windows App SDK
+bindings are installed.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from core.env_file import EnvVariable, parse_env_line, parse_env_lines, serialize_env
+
+
+class TestParseEnvLine:
+    """Parsing single .env lines."""
+
+    def test_plain_assignment(self):
+        """NAME=value should give an enabled variable."""
+        var = parse_env_line("YASB_FONT_ENGINE=native\n")
+        assert (var.name, var.value, var.enabled) == ("YASB_FONT_ENGINE", "native", True)
+
+    def test_strips_whitespace_around_name_and_value(self):
+        """Spaces around the name, the '=' and the value are not part of them."""
+        var = parse_env_line("  NAME =  value  ")
+        assert (var.name, var.value) == ("NAME", "value")
+
+    def test_value_keeps_later_equals_signs(self):
+        """Only the first '=' separates name and value."""
+        var = parse_env_line("QUERY=a=b")
+        assert (var.name, var.value) == ("QUERY", "a=b")
+
+    def test_commented_assignment_is_disabled(self):
+        """A commented-out assignment is a disabled variable."""
+        var = parse_env_line("# YASB_GITHUB_TOKEN=abc")
+        assert (var.name, var.value, var.enabled) == ("YASB_GITHUB_TOKEN", "abc", False)
+
+    def test_double_quoted_value_unescapes_quotes(self):
+        """Double quotes are removed and escaped quotes inside them restored."""
+        var = parse_env_line('LABEL="say \\"hi\\""')
+        assert var.value == 'say "hi"'
+
+    def test_single_quoted_value(self):
+        """Single quotes are removed as-is."""
+        var = parse_env_line("LABEL='two words'")
+        assert var.value == "two words"
+
+    @pytest.mark.parametrize("line", ["", "   \n", "# YASB Environment Variables", "NOT_AN_ASSIGNMENT"])
+    def test_non_assignments_are_skipped(self, line):
+        """Blank lines, plain comments and lines without '=' give nothing."""
+        assert parse_env_line(line) is None
+
+
+class TestSerializeEnv:
+    """Writing variables back to .env content."""
+
+    def test_empty(self):
+        """No variables means an empty file."""
+        assert serialize_env([]) == ""
+
+    def test_plain_and_disabled(self):
+        """Disabled variables are written commented out, one per line."""
+        content = serialize_env([EnvVariable("A", "1", True), EnvVariable("B", "2", False)])
+        assert content == "A=1\n# B=2\n"
+
+    def test_skips_unnamed_rows(self):
+        """A row the user has not named yet is not written."""
+        assert serialize_env([EnvVariable("", "value", True), EnvVariable("  ", "", True)]) == ""
+
+    @pytest.mark.parametrize("value", ["two words", "a#b", "it's", 'say "hi"'])
+    def test_quotes_values_that_need_it(self, value):
+        """Whitespace, '#' and quotes force a double-quoted value."""
+        assert serialize_env([EnvVariable("X", value, True)]).startswith('X="')
+
+    def test_escapes_double_quotes(self):
+        """Double quotes inside a value are escaped."""
+        assert serialize_env([EnvVariable("X", 'say "hi"', True)]) == 'X="say \\"hi\\""\n'
+
+
+class TestRoundTrip:
+    """What is written must read back the same."""
+
+    @pytest.mark.parametrize(
+        "value",
+        ["native", "", "two words", "a#b", "it's", 'say "hi"', '"quoted"', "'single'", "C:\\path with space"],
+    )
+    def test_value_survives_write_and_read(self, value):
+        """Serializing then parsing gives back the original variable."""
+        original = [EnvVariable("X", value, True), EnvVariable("Y", value, False)]
+        parsed = parse_env_lines(serialize_env(original).splitlines())
+
+        assert [(v.name, v.value, v.enabled) for v in parsed] == [("X", value, True), ("Y", value, False)]
+
+    def test_file_content_is_stable(self):
+        """Reading and rewriting a file leaves it unchanged."""
+        content = 'YASB_FONT_ENGINE=native\n# YASB_GITHUB_TOKEN=abc\nLABEL="two words"\n'
+        assert serialize_env(parse_env_lines(content.splitlines())) == content
+
+
+@pytest.fixture
+def page(tmp_path, monkeypatch):
+    """Page writing to a temporary .env, with the row UI replaced by plain registration."""
+    pytest.importorskip("winui3.microsoft.ui.xaml")
+    from pages.env_variables import EnvVariablesPage
+
+    page = EnvVariablesPage(SimpleNamespace(_config_manager=None))
+    page._env_path = str(tmp_path / ".env")
+
+    def register_rows():
+        page._rows = {var: None for var in page._variables}
+
+    monkeypatch.setattr(page, "_rebuild_variables_list", register_rows)
+    return page
+
+
+class TestAddVariable:
+    """Adding a variable from the page."""
+
+    def test_add_then_save(self, page, tmp_path):
+        """A new row can be named, given a value and saved."""
+        page._add_variable()
+        var = page._variables[-1]
+
+        page._update_variable_name(var, "YASB_TEST")
+        page._update_variable_value(var, "some value")
+
+        assert (tmp_path / ".env").read_text(encoding="utf-8") == 'YASB_TEST="some value"\n'
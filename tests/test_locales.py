@@ -47,7 +47,7 @@ def get_keys_in_order(data):
 class TestLocaleConsistency:
     """Make sure all locale files have the same structure."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def reference_locale(self):
         """Load en.json as our reference."""
         ref_path = LOCALES_DIR / REFERENCE_LOCALE
@@ -55,11 +55,16 @@ class TestLocaleConsistency:
             pytest.skip(f"Reference locale not found: {ref_path}")
         return load_json_preserve_order(ref_path)
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def reference_keys(self, reference_locale):
         """Extract the keys from en.json in order."""
         return get_keys_in_order(reference_locale)
 
+    @pytest.fixture(scope="session")
+    def reference_keys_set(self, reference_keys):
+        """The en.json keys as a set, built once for the key comparisons."""
+        return frozenset(reference_keys)
+
     def test_reference_locale_exists(self):
         """Check that en.json actually exists."""
         ref_path = LOCALES_DIR / REFERENCE_LOCALE
@@ -84,37 +89,35 @@ class TestLocaleConsistency:
         assert len(data) > 0, f"{locale_file.name} must not be empty"
 
     @pytest.mark.parametrize("locale_file", get_locale_files())
-    def test_locale_has_all_keys(self, locale_file, reference_keys):
+    def test_locale_has_all_keys(self, locale_file, reference_keys_set):
         """Make sure no translation keys are missing."""
         if locale_file.name == REFERENCE_LOCALE:
             return
 
         locale_data = load_json_preserve_order(locale_file)
-        locale_keys = get_keys_in_order(locale_data)
 
-        missing_keys = set(reference_keys) - set(locale_keys)
+        missing_keys = reference_keys_set - locale_data.keys()
 
         assert not missing_keys, f"{locale_file.name} is missing the following keys:\n" + "\n".join(
             f"  - {key}" for key in sorted(missing_keys)
         )
 
     @pytest.mark.parametrize("locale_file", get_locale_files())
-    def test_locale_has_no_extra_keys(self, locale_file, reference_keys):
+    def test_locale_has_no_extra_keys(self, locale_file, reference_keys_set):
         """Check for keys that shouldn't be there."""
         if locale_file.name == REFERENCE_LOCALE:
             return
 
         locale_data = load_json_preserve_order(locale_file)
-        locale_keys = get_keys_in_order(locale_data)
 
-        extra_keys = set(locale_keys) - set(reference_keys)
+        extra_keys = locale_data.keys() - reference_keys_set
 
         assert not extra_keys, f"{locale_file.name} has the following extra keys:\n" + "\n".join(
             f"  - {key}" for key in sorted(extra_keys)
         )
 
     @pytest.mark.parametrize("locale_file", get_locale_files())
-    def test_locale_key_order_matches_reference(self, locale_file, reference_keys):
+    def test_locale_key_order_matches_reference(self, locale_file, reference_keys, reference_keys_set):
         """Keys should be in the same order as en.json (makes git diffs cleaner)."""
         if locale_file.name == REFERENCE_LOCALE:
             return
@@ -123,7 +126,7 @@ class TestLocaleConsistency:
         locale_keys = get_keys_in_order(locale_data)
 
         # Only check order if keys match (other tests handle missing/extra keys)
-        if set(locale_keys) != set(reference_keys):
+        if locale_data.keys() != reference_keys_set:
             pytest.skip(f"{locale_file.name} has different keys (tested separately)")
 
         mismatched_positions = []
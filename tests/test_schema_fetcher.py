@@ -5,14 +5,13 @@ Tests schema parsing, hierarchy building, database operations.
 """
 
 import json
-import sys
-from pathlib import Path
+import os
+import urllib.error
 
 import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
-
+from core.constants import APP_VERSION
 from core.schema_fetcher import (
+    SCHEMA_JSON_URL,
     _build_key_hierarchy,
     _extract_widget_option_schemas,
     get_all_widget_types,
@@ -20,6 +19,7 @@ from core.schema_fetcher import (
     get_widget_schema,
     load_schema_database,
     save_schema_database,
+    update_schema_database,
 )
 
 
@@ -87,6 +87,18 @@ class TestDatabaseOperations:
             saved = json.load(f)
         assert saved == data
 
+    def test_load_reuses_parsed_database(self, sample_schema_db):
+        """Should parse the file once and re-read it only after it changes."""
+        first = load_schema_database()
+        assert load_schema_database() is first
+
+        data = {"_meta": {"version": 1}, "widgets": {"test.Widget": {}}}
+        with open(sample_schema_db, "w") as f:
+            json.dump(data, f)
+        os.utime(sample_schema_db, ns=(0, sample_schema_db.stat().st_mtime_ns + 1_000_000))
+
+        assert load_schema_database() == data
+
     def test_save_creates_parent_directory(self, tmp_path, monkeypatch):
         """Should create parent directories if needed."""
         nested_path = tmp_path / "nested" / "dir" / "schemas.json"
@@ -279,3 +291,68 @@ class TestJsonSchemaVariants:
 
         assert "callbacks" in result
         assert result["callbacks"]["type"] == "dict"
+
+
+# --- Conditional Download ---
+
+
+class TestConditionalUpdate:
+    """Tests for skipping the download when schema.json has not changed."""
+
+    def test_not_modified_keeps_database(self, sample_schema_db, monkeypatch):
+        """Should send the stored validators and leave the database untouched on 304."""
+        data = json.loads(sample_schema_db.read_text())
+        data["_meta"].update(
+            {
+                "source": SCHEMA_JSON_URL,
+                "app_version": APP_VERSION,
+                "etag": '"abc"',
+                "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            }
+        )
+        sample_schema_db.write_text(json.dumps(data))
+        before = sample_schema_db.read_bytes()
+        sent = {}
+
+        def fake_urlopen(req, timeout=None):
+            sent.update(req.headers)
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+
+        monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+        success, _ = update_schema_database()
+
+        assert success
+        assert sent["If-none-match"] == '"abc"'
+        assert sent["If-modified-since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert sample_schema_db.read_bytes() == before
+
+    def test_foreign_database_is_not_conditional(self, sample_schema_db, monkeypatch):
+        """Should not send validators for a database built from another source."""
+        sent = {}
+
+        def fake_urlopen(req, timeout=None):
+            sent.update(req.headers)
+            raise urllib.error.URLError("offline")
+
+        monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+        success, _ = update_schema_database()
+
+        assert not success
+        assert "If-none-match" not in sent
+
+    def test_other_app_version_is_not_conditional(self, sample_schema_db, monkeypatch):
+        """Should rebuild a database written by another app version even if its ETag still matches."""
+        data = json.loads(sample_schema_db.read_text())
+        data["_meta"].update({"source": SCHEMA_JSON_URL, "app_version": "0.0.0", "etag": '"abc"'})
+        sample_schema_db.write_text(json.dumps(data))
+        sent = {}
+
+        def fake_urlopen(req, timeout=None):
+            sent.update(req.headers)
+            raise urllib.error.URLError("offline")
+
+        monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+        success, _ = update_schema_database()
+
+        assert not success
+        assert "If-none-match" not in sent
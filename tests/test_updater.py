@@ -5,14 +5,9 @@ Tests update metadata, registry validation, and update flow.
 """
 
 import json
-import sys
 from datetime import datetime, timedelta
-from pathlib import Path
 
 import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
-
 from core.updater import AssetUpdater
 
 
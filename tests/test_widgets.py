@@ -9,12 +9,9 @@ Fixtures in tests/fixtures/ represent real widget configs we need to handle.
 """
 
 import re
-import sys
 from pathlib import Path
 
 import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
 from core.code_editor import fix_yaml_indentation, validate_yaml
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -112,6 +109,23 @@ key2: value2"""
         is_valid, _ = validate_yaml(result)
         assert is_valid
 
+    def test_composite_key_list_items(self, monkeypatch):
+        """List items under a nested list should use the composite key's children."""
+        hierarchy = {
+            "_root": {"type": "dict", "children": ["label", "providers"]},
+            "providers": {"type": "list", "children": ["provider", "models"]},
+            "providers.models": {"type": "list", "children": ["name", "label"]},
+        }
+        monkeypatch.setattr("core.code_editor._get_widget_key_hierarchy", lambda widget_type: hierarchy)
+        flat = "label: AI\nproviders:\n- provider: A\nmodels:\n- name: m1\nlabel: M1\n- name: m2"
+
+        result, error = fix_yaml_indentation(flat, "yasb.ai_chat.AiChatWidget")
+
+        assert error is None
+        assert result == (
+            "label: AI\nproviders:\n  - provider: A\n    models:\n      - name: m1\n        label: M1\n      - name: m2"
+        )
+
     def test_tabs_converted_to_spaces(self):
         """Tabs should get converted to spaces."""
         yaml_with_tabs = "label: test\nchat:\n\tblur: true"